@@ -1,5 +1,7 @@
+import logging
 import os
 from pymongo import AsyncMongoClient
+from pymongo.errors import OperationFailure
 from beanie import init_beanie
 
 from app.models.incidents import IndustryOverview
@@ -7,18 +9,30 @@ from app.models.incidents import IndustryOverview
 
 MONGO_URI = os.getenv("MONGO_URI")
 
+logger = logging.getLogger(__name__)
 
-async def init_db():
+
+async def init_db() -> AsyncMongoClient:
     """
     Initializes the Beanie connection to the database.
+    Returns the client so the application can close its pool on shutdown.
     """
     from app.models.articles import Source
     from app.models.incidents import IncidentReport
 
     if not MONGO_URI:
         raise ValueError("MONGO_URI environment variable is not set")
-    client = AsyncMongoClient(MONGO_URI)
+    # One pooled client per worker process, kept warm between requests
+    client = AsyncMongoClient(
+        MONGO_URI,
+        maxPoolSize=100,
+        minPoolSize=10,
+        maxIdleTimeMS=60_000,
+        waitQueueTimeoutMS=2_500,
+    )
 
+    # No document mixes in LogMixin yet; register Log here and start its
+    # writer (app.models.logs.start_log_writer) once one does
     await init_beanie(
         database=client.get_database("iuuIncidents"),  # Use get_database() for clarity
         document_models=[
@@ -28,3 +42,27 @@ async def init_db():
         ],  # Pass all Beanie Documents here
     )
     print("Database initialized successfully.")
+    await _ensure_search_indexes()
+    return client
+
+
+async def _ensure_search_indexes():
+    """
+    Creates the Atlas Search index on incident vessel names when it is missing.
+    Deployments without Atlas Search (e.g. the local community server) skip
+    it with a warning.
+    """
+    from app.models.incidents import (
+        INCIDENT_DUPLICATE_SEARCH_INDEX,
+        INCIDENT_DUPLICATE_SEARCH_INDEX_NAME as name,
+        IncidentReport,
+    )
+
+    collection = IncidentReport.get_pymongo_collection()
+    try:
+        # Every worker runs this on boot; only create the index when missing
+        cursor = await collection.list_search_indexes(name)
+        if not await cursor.to_list():
+            await collection.create_search_index(INCIDENT_DUPLICATE_SEARCH_INDEX)
+    except OperationFailure as e:
+        logger.warning("Search index %s not created: %s", name, e.details)
@@ -27,14 +27,14 @@ class AnalysisPipeline:
         """
         try:
             if not source.article_scope:
-                logger.info(f"Classifying article scope: '{source.article_hash}'")
+                logger.info("Classifying article scope: '%s'", source.article_hash)
                 source = await self.source_scope.run(source=source)
 
             article_type = source.article_scope.articleType
 
             if article_type == "Unrelated to IUU Fishing":
                 logger.info(
-                    f"Article '{source.article_hash}' is unrelated to IUU fishing."
+                    "Article '%s' is unrelated to IUU fishing.", source.article_hash
                 )
                 return dspy.Prediction(
                     sources=[source],
@@ -42,7 +42,9 @@ class AnalysisPipeline:
                 )
 
             elif article_type == "Industry Overview":
-                logger.info(f"Article '{source.article_hash}' is an industry overview.")
+                logger.info(
+                    "Article '%s' is an industry overview.", source.article_hash
+                )
                 module_output = await self.industry_overview_tool.acall(source=source)
                 return dspy.Prediction(
                     sources=[source],
@@ -50,7 +52,7 @@ class AnalysisPipeline:
                 )
             elif article_type == "Multiple Incidents":
                 logger.info(
-                    f"Article '{source.article_hash}' contains multiple incidents."
+                    "Article '%s' contains multiple incidents.", source.article_hash
                 )
                 module_output = await self.incident_analysis_tool.acall(source=source)
                 return dspy.Prediction(
@@ -59,7 +61,7 @@ class AnalysisPipeline:
                 )
             else:  # "Single Incident"
                 logger.info(
-                    f"Article '{source.article_hash}' contains a single incident."
+                    "Article '%s' contains a single incident.", source.article_hash
                 )
                 module_output = await self.incident_analysis_tool.acall(source=source)
                 return dspy.Prediction(
@@ -69,5 +71,5 @@ class AnalysisPipeline:
                 )
 
         except Exception as e:
-            logger.error(f"Error during analysis pipeline for '{source.url}': {e}")
+            logger.error("Error during analysis pipeline for '%s': %s", source.url, e)
             raise
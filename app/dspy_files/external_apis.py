@@ -1,10 +1,25 @@
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import quote
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def create_http_session(pool_maxsize: int = 100) -> requests.Session:
+    """Create a keep-alive session with a connection pool shared across scrapes."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Reused by the API helpers below so repeated and paginated calls to the same
+# host keep their connections instead of paying a new TLS handshake each time
+_api_session = create_http_session(pool_maxsize=32)
+
+
 def fetch_taxon_cites(taxon_name: str, page: int, api_key: str) -> dict:
     """Fetch CITES data for a given taxon name using the CITES API."""
     url = "https://api.speciesplus.net/api/v1/taxon_concepts"
@@ -19,11 +34,11 @@ def fetch_taxon_cites(taxon_name: str, page: int, api_key: str) -> dict:
         "page": page,
     }
     try:
-        response = requests.get(url, params=params, headers=headers)
+        response = _api_session.get(url, params=params, headers=headers)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
-        logger.error(f"Error fetching data for {taxon_name}: {e}")
+        logger.error("Error fetching data for %s: %s", taxon_name, e)
         return {}
 
 
@@ -38,21 +53,21 @@ def fetch_all_cites_pages(taxon_name: str, api_key: str) -> dict:
         data = fetch_taxon_cites(taxon_name, current_page, api_key)
 
         if not data or "taxon_concepts" not in data:
-            logger.warning(f"No data returned for page {current_page}")
+            logger.warning("No data returned for page %s", current_page)
             break
 
         if current_page == 1:
             total_entries = data.get("pagination", {}).get("total_entries", 0)
             if total_entries == 0:
                 logger.warning(
-                    f"No entries found for {taxon_name} on page {current_page}."
+                    "No entries found for %s on page %s.", taxon_name, current_page
                 )
                 break
-            logger.info(f"Total entries to fetch: {total_entries}")
+            logger.info("Total entries to fetch: %s", total_entries)
 
         page_taxa = data.get("taxon_concepts", [])
         all_taxon_concepts.extend(page_taxa)
-        logger.info(f"Fetched page {current_page} with {len(page_taxa)} entries.")
+        logger.info("Fetched page %s with %s entries.", current_page, len(page_taxa))
 
         if (
             len(page_taxa) < CITES_ENTRIES_PER_PAGE
@@ -71,7 +86,9 @@ def fetch_all_cites_pages(taxon_name: str, api_key: str) -> dict:
         "taxon_concepts": all_taxon_concepts,
     }
     logger.info(
-        f"Successfully merged {len(all_taxon_concepts)} taxon concepts from {current_page} pages"
+        "Successfully merged %s taxon concepts from %s pages",
+        len(all_taxon_concepts),
+        current_page,
     )
     return merged_response
 
@@ -89,11 +106,11 @@ def fetch_iucn_red_list(
         "latest": str(latest).lower(),
     }
     try:
-        response = requests.get(url, params=params, headers=headers)
+        response = _api_session.get(url, params=params, headers=headers)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
-        logger.error(f"Error fetching data for {taxon_name}: {e}")
+        logger.error("Error fetching data for %s: %s", taxon_name, e)
         return {}
 
 
@@ -107,12 +124,14 @@ def fetch_all_iucn_pages(taxon_rank: str, taxon_name: str, api_key: str) -> dict
         data = fetch_iucn_red_list(taxon_rank, taxon_name, current_page, api_key)
 
         if not data or "assessments" not in data:
-            logger.warning(f"No data returned for page {current_page}")
+            logger.warning("No data returned for page %s", current_page)
             break
 
         page_assements = data.get("assessments", [])
         all_assessments.extend(page_assements)
-        logger.info(f"Fetched page {current_page} with {len(page_assements)} entries.")
+        logger.info(
+            "Fetched page %s with %s entries.", current_page, len(page_assements)
+        )
 
         if len(page_assements) < IUCN_ENTRIES_PER_PAGE:
             break
@@ -127,7 +146,7 @@ def fetch_all_iucn_pages(taxon_rank: str, taxon_name: str, api_key: str) -> dict
         "result": all_assessments,
     }
     logger.info(
-        f"Successfully merged {len(all_assessments)} taxa from {current_page} pages"
+        "Successfully merged %s taxa from %s pages", len(all_assessments), current_page
     )
     return merged_response
 
@@ -143,11 +162,11 @@ def fetch_IUCN_by_scientific_name(scientific_name: str, api_key: str) -> dict:
     url = f"https://api.iucnredlist.org/api/v4/taxa/scientific_name/{scientific_name_encoded}"
     headers = {"Authorization": f"Bearer {api_key}", "Accept": "application/json"}
     try:
-        response = requests.get(url, headers=headers)
+        response = _api_session.get(url, headers=headers)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
-        logger.error(f"Error fetching data for {scientific_name}: {e}")
+        logger.error("Error fetching data for %s: %s", scientific_name, e)
         return {}
 
 
@@ -159,11 +178,11 @@ def fetch_scientific_name(common_name: str) -> dict:
         "Accept": "application/json",
     }
     try:
-        response = requests.get(url, headers=headers)
+        response = _api_session.get(url, headers=headers)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
-        logger.error(f"Error fetching scientific name for {common_name}: {e}")
+        logger.error("Error fetching scientific name for %s: %s", common_name, e)
         return {}
 
 
@@ -171,7 +190,7 @@ def get_name_pairs(common_name: str) -> list:
     """Fetch a list of scientific and common name pairs for a given common name fragment."""
     response = fetch_scientific_name(common_name)
     if not response:
-        logger.warning(f"No data found for common name: {common_name}")
+        logger.warning("No data found for common name: %s", common_name)
         return []
     species_list = response["sci_names_and_ids"]
     name_pairs = [
@@ -206,11 +225,11 @@ def get_articles_by_date(
         }
 
     try:
-        response = requests.get(url, params=params, headers=headers)
+        response = _api_session.get(url, params=params, headers=headers)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
-        logger.error(f"Error fetching articles: {e}")
+        logger.error("Error fetching articles: %s", e)
         return {}
 
 
@@ -226,21 +245,26 @@ def get_all_articles_by_date(
         data = get_articles_by_date(api_key, keywords, from_date, to_date, current_page)
 
         if not data or "articles" not in data:
-            logger.warning(f"No data returned for page {current_page}")
+            logger.warning("No data returned for page %s", current_page)
             break
 
         if current_page == 1:
             total_results = data.get("totalResults", 0)
             if total_results == 0:
                 logger.warning(
-                    f"No articles found for {keywords} from {from_date} to {to_date}."
+                    "No articles found for %s from %s to %s.",
+                    keywords,
+                    from_date,
+                    to_date,
                 )
                 break
-            logger.info(f"Total articles to fetch: {total_results}")
+            logger.info("Total articles to fetch: %s", total_results)
 
         page_articles = data.get("articles", [])
         all_articles.extend(page_articles)
-        logger.info(f"Fetched page {current_page} with {len(page_articles)} articles.")
+        logger.info(
+            "Fetched page %s with %s articles.", current_page, len(page_articles)
+        )
 
         if len(page_articles) < 100 or len(all_articles) >= total_results:
             break
@@ -262,6 +286,6 @@ def get_all_articles_by_date(
         "articles": all_articles,
     }
     logger.info(
-        f"Successfully merged {len(all_articles)} articles from {current_page} pages"
+        "Successfully merged %s articles from %s pages", len(all_articles), current_page
     )
     return merged_response
@@ -1,8 +1,12 @@
 from typing import Dict
-from pdf2image import convert_from_bytes
+import functools
+import threading
+from collections import OrderedDict
+from pdf2image import convert_from_bytes, convert_from_path
 from app.dspy_files.external_apis import get_name_pairs
 import fitz
 import pytesseract
+from PIL import Image
 import pandas as pd
 import logging
 
@@ -20,32 +24,55 @@ def verify_sci_name(common_name: str, predicted_sci_name: str) -> bool:
     Returns:
         bool: True if the predicted scientific name matches any known scientific names, False otherwise.
     """
-    name_pairs = get_name_pairs(common_name)
-    for sci_name, _ in name_pairs:
-        if sci_name.lower() == predicted_sci_name.lower():
-            return True
-    return False
+    return predicted_sci_name.lower() in _scientific_names(common_name)
 
 
-def extract_text_pdf(pdf_byes: bytes) -> Dict[str, any]:
+# Lowercased scientific names per common name. Only non-empty lookups are
+# kept: an empty result may be a failed request that should be retried.
+_SCI_NAME_CACHE_SIZE = 10_000
+_sci_name_cache: OrderedDict[str, frozenset[str]] = OrderedDict()
+# Lookups run in worker threads; the lock is not held over the API call
+_sci_name_lock = threading.Lock()
+
+
+def _scientific_names(common_name: str) -> frozenset[str]:
+    # Normalized only for the cache key; the API is queried with the name as given
+    key = common_name.lower().strip()
+    with _sci_name_lock:
+        names = _sci_name_cache.get(key)
+        if names is not None:
+            _sci_name_cache.move_to_end(key)
+            return names
+
+    names = frozenset(sci_name.lower() for sci_name, _ in get_name_pairs(common_name))
+    if names:
+        with _sci_name_lock:
+            _sci_name_cache[key] = names
+            if len(_sci_name_cache) > _SCI_NAME_CACHE_SIZE:
+                _sci_name_cache.popitem(last=False)
+    return names
+
+
+def _open_pdf(pdf: bytes | str) -> fitz.Document:
+    """Opens a PDF from raw bytes or from a file path"""
+    if isinstance(pdf, str):
+        return fitz.open(pdf, filetype="pdf")
+    return fitz.open(stream=pdf, filetype="pdf")
+
+
+def extract_text_pdf(pdf: bytes | str) -> Dict[str, any]:
     """
     Extracts text and metadata from PDF using PyMuPDF.
 
     Args:
-        pdf_bytes: Raw PDF file bytes
-        filename: Original filename for logging/metadata
+        pdf: Raw PDF file bytes or a path to the PDF file
 
     Returns:
         Dictionary containing extracted text and metadata
     """
     try:
-        doc = fitz.open(stream=pdf_byes, filetype="pdf")
-        full_text = ""
-
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            page_text = page.get_text()
-            full_text += page_text
+        doc = _open_pdf(pdf)
+        full_text = "".join(page.get_text() for page in doc)
 
         metadata = doc.metadata
         doc_info = {
@@ -58,35 +85,36 @@ def extract_text_pdf(pdf_byes: bytes) -> Dict[str, any]:
 
         doc.close()
         if not full_text.strip():
-            logger.warning(f"No text extracted from PDF")
+            logger.warning("No text extracted from PDF")
             raise ValueError(
                 "No text content found in PDF. Document may be scanned or image-based."
             )
 
         return {"text": full_text.strip(), "metadata": doc_info}
     except IOError:
-        logger.error(f"IO Exception when reading pdf bytes")
+        logger.error("IO Exception when reading pdf bytes")
         raise
 
 
-def ocr_pdf_with_pytesseract(pdf_bytes: bytes) -> Dict[str, any]:
+def ocr_pdf_with_pytesseract(pdf: bytes | str) -> Dict[str, any]:
     """
     Performs OCR on each page of a scanned PDF and extracts text.
 
     Args:
-        pdf_bytes (bytes): The raw bytes of the PDF file.
-        language (str): Language(s) to use for OCR.
+        pdf (bytes | str): The raw bytes of the PDF file or a path to it.
 
     Returns:
         Dict[str, any]: Extracted text and basic metadata.
     """
     try:
-        images = convert_from_bytes(pdf_bytes)
-        full_text = ""
-
-        for idx, image in enumerate(images):
-            page_text = pytesseract.image_to_string(image).strip()
-            full_text += f"\n\n--- Page {idx + 1} ---\n" + page_text
+        if isinstance(pdf, str):
+            images = convert_from_path(pdf)
+        else:
+            images = convert_from_bytes(pdf)
+        full_text = "".join(
+            f"\n\n--- Page {idx + 1} ---\n" + pytesseract.image_to_string(image).strip()
+            for idx, image in enumerate(images)
+        )
 
         if not full_text.strip():
             logger.warning("No text extracted via OCR from PDF.")
@@ -97,18 +125,24 @@ def ocr_pdf_with_pytesseract(pdf_bytes: bytes) -> Dict[str, any]:
         return {"text": full_text.strip(), "metadata": metadata}
 
     except Exception as e:
-        logger.error(f"OCR failed on scanned PDF: {e}")
+        logger.error("OCR failed on scanned PDF: %s", e)
         raise
 
 
+def read_image(image_path: str, language: str = "eng") -> str:
+    """Extracts text from an image file using OCR."""
+    with Image.open(image_path) as image:
+        return pytesseract.image_to_string(image, lang=language).strip()
+
+
 def needs_ocr_sampled(
-    pdf_bytes: bytes, sample_pages: int = 3, min_text_length: int = 10
+    pdf: bytes | str, sample_pages: int = 3, min_text_length: int = 10
 ) -> bool:
     """
     Check the first few pages of a PDF to determine if OCR is likely needed.
 
     Args:
-        pdf_bytes (bytes): PDF content.
+        pdf (bytes | str): PDF content or a path to the PDF file.
         sample_pages (int): Number of pages to sample.
         min_text_length (int): Minimum total text length to assume it's not scanned.
 
@@ -116,15 +150,11 @@ def needs_ocr_sampled(
         bool: True if OCR is likely needed, False otherwise.
     """
     try:
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        doc = _open_pdf(pdf)
         total_pages = len(doc)
         pages_to_check = min(sample_pages, total_pages)
 
-        total_text = ""
-        for i in range(pages_to_check):
-            page = doc[i]
-            text = page.get_text().strip()
-            total_text += text
+        total_text = "".join(doc[i].get_text().strip() for i in range(pages_to_check))
 
         doc.close()
 
@@ -134,13 +164,14 @@ def needs_ocr_sampled(
         return True
 
 
-def read_pdf(pdf_bytes: bytes) -> Dict[str, any]:
-    if needs_ocr_sampled(pdf_bytes):
+def read_pdf(pdf: bytes | str) -> Dict[str, any]:
+    """Reads a PDF given as raw bytes or as a file path"""
+    if needs_ocr_sampled(pdf):
         logger.info("PDF appears to be scanned; using OCR.")
-        return ocr_pdf_with_pytesseract(pdf_bytes)
+        return ocr_pdf_with_pytesseract(pdf)
     else:
         logger.info("PDF appears to contain text; using text extraction.")
-        return read_pdf(pdf_bytes)
+        return extract_text_pdf(pdf)
 
 
 def verify_name_against_asfis(common_name: str, predicted_sci_name: str) -> bool:
@@ -154,8 +185,11 @@ def verify_name_against_asfis(common_name: str, predicted_sci_name: str) -> bool
     Returns:
         bool: True if the scientific name is verified, False otherwise.
     """
+    return predicted_sci_name.lower() in _asfis_scientific_names()
 
-    asfis = pd.read_csv("data/ASFIS_sp_2025.csv")
 
-    if predicted_sci_name.lower() in asfis["Scientific Name"].str.lower().values:
-        return
+@functools.lru_cache(maxsize=1)
+def _asfis_scientific_names() -> frozenset[str]:
+    """Lowercased ASFIS scientific names, read from disk once per process"""
+    asfis = pd.read_csv("data/ASFIS_sp_2025.csv", usecols=["Scientific Name"])
+    return frozenset(asfis["Scientific Name"].dropna().str.lower())
@@ -1,12 +1,11 @@
 from __future__ import annotations
-from enum import Enum
 import traceback
-from typing import List
 
 import dspy
-from pydantic import BaseModel, Field
+import requests
 from app.dspy_files.content_extraction import ContentExtractor
 from app.dspy_files.analysis_pipeline import AnalysisPipeline
+from app.dspy_files.pipeline_output import PipelineOutput, PipelineResult
 from app.dspy_files.postprocessing import format_report
 from app.models.articles import Source
 from app.models.incidents import IncidentReport, IndustryOverview
@@ -16,48 +15,9 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-class PipelineResult(Enum):
-    """Enum for pipeline result status"""
-
-    SUCCESS = "success"
-    INVALID_INPUT = "invalid_input"
-    FAILED_EXTRACTION = "failed_extraction"
-    FAILED_CLASSIFICATION = "failed_classification"
-    FAILED_ANALYSIS = "failed_analysis"
-    FAILED_FORMATTING = "failed_formatting"
-    UNRELATED_CONTENT = "unrelated_content"
-    DUPLICATE_HASHED_TEXT = "duplicate_hashed_text"
-
-
-class PipelineOutput(BaseModel):
-    """Structured output from the pipeline"""
-
-    status: PipelineResult
-    source: Source | None = None
-    incidents: List[IncidentReport] = Field(default_factory=list)
-    industry_overview: IndustryOverview | None = None
-    error_message: str | None = None
-
-    @property
-    def is_success(self) -> bool:
-        return self.status == PipelineResult.SUCCESS
-
-    @property
-    def is_unrelated(self) -> bool:
-        return self.status == PipelineResult.UNRELATED_CONTENT
-
-    @property
-    def has_incident(self) -> bool:
-        return len(self.incidents) != 0
-
-    @property
-    def has_overview(self) -> bool:
-        return self.industry_overview is not None
-
-
 class AnalysisOrchestrator:
-    def __init__(self, api_key: str):
-        self.extractor = ContentExtractor(api_key=api_key)
+    def __init__(self, api_key: str, session: requests.Session | None = None):
+        self.extractor = ContentExtractor(api_key=api_key, session=session)
         self.pipeline = AnalysisPipeline(api_key=api_key)
 
     async def run_full_analysis_from_url(self, url: str) -> PipelineOutput:
@@ -66,10 +26,10 @@ class AnalysisOrchestrator:
         """
 
         try:
-            logging.info(f"Starting analysis for: {url}")
+            logger.info("Starting analysis for: %s", url)
             source = await self.extractor.from_url(url)
         except Exception as e:
-            logging.error(f"Content Extraction failed for {url}: {e}")
+            logger.error("Content Extraction failed for %s: %s", url, e)
             return PipelineOutput(
                 status=PipelineResult.FAILED_EXTRACTION, error_message=str(e)
             )
@@ -83,13 +43,13 @@ class AnalysisOrchestrator:
                 error_message="Text is too short to analyze",
             )
         try:
-            logging.info(f"Starting analysis for: {text[:50]}...")
+            logger.info("Starting analysis for: %s...", text[:50])
             source = Source(article_text=text, category="text_upload")
             existing_source = await Source.find_one(
                 {"article_hash": source.article_hash}
             )
             if existing_source:
-                logger.info(f"Source already exists: {existing_source.id}")
+                logger.info("Source already exists: %s", existing_source.id)
                 return PipelineOutput(
                     status=PipelineResult.DUPLICATE_HASHED_TEXT,
                     source=existing_source,
@@ -98,7 +58,7 @@ class AnalysisOrchestrator:
 
             logger.info(source.article_text[:50])
         except Exception as e:
-            logging.error(f"Error creating source from: {text[:50]}... : {e}")
+            logger.error("Error creating source from: %s... : %s", text[:50], e)
             return PipelineOutput(
                 status=PipelineResult.FAILED_EXTRACTION, error_message=str(e)
             )
@@ -106,7 +66,7 @@ class AnalysisOrchestrator:
 
     async def analysis_from_source(self, source: Source) -> PipelineOutput:
         logger.info(
-            f"Running analysis for source (article_hash): {source.article_hash}"
+            "Running analysis for source (article_hash): %s", source.article_hash
         )
         try:
             prediction = await self.pipeline.run(source)
@@ -117,7 +77,7 @@ class AnalysisOrchestrator:
                     error_message="Anaysis Pipeline returned no result",
                 )
         except Exception as e:
-            logging.error(f"Analysis failed for {source.id}: {e}")
+            logger.error("Analysis failed for %s: %s", source.id, e)
             return PipelineOutput(
                 status=PipelineResult.FAILED_ANALYSIS,
                 source=source,
@@ -127,14 +87,14 @@ class AnalysisOrchestrator:
         try:
             scope = source.article_scope.articleType
             if scope == "Unrelated to IUU Fishing":
-                logger.info(f"Article from {source.id} is unrelated to IUU fishing")
+                logger.info("Article from %s is unrelated to IUU fishing", source.id)
                 return PipelineOutput(
                     status=PipelineResult.UNRELATED_CONTENT, source=source
                 )
             elif scope == "Industry Overview":
-                logger.info(f"Article from {source.id} is an industry overview")
+                logger.info("Article from %s is an industry overview", source.id)
                 logger.debug(
-                    f"prediction.parsed_data type: {type(prediction.parsed_data)}"
+                    "prediction.parsed_data type: %s", type(prediction.parsed_data)
                 )
 
                 try:
@@ -142,7 +102,7 @@ class AnalysisOrchestrator:
                         extracted_information=prediction.parsed_data,
                     )
                     source.overview = overview
-                    logger.info(f"Successfully created overview: {overview}")
+                    logger.info("Successfully created overview: %s", overview)
                     return PipelineOutput(
                         status=PipelineResult.SUCCESS,
                         source=source,
@@ -150,11 +110,11 @@ class AnalysisOrchestrator:
                     )
                 except Exception as e:
                     logger.error(
-                        f"Error creating IndustryOverview: {type(e).__name__}: {str(e)}"
+                        "Error creating IndustryOverview: %s: %s", type(e).__name__, e
                     )
                     raise  # Re-raise to be caught by outer exception handler
             elif scope == "Multiple Incidents":
-                logger.info(f"Article from {source.id} contains multiple incidents")
+                logger.info("Article from %s contains multiple incidents", source.id)
                 incident_list = []
                 for incident in prediction.incidents:
                     sub_prediction = dspy.Prediction(
@@ -167,7 +127,8 @@ class AnalysisOrchestrator:
                     )
                     if not processed:
                         logger.error(
-                            f"Failed to process incident prediction for {incident.parsed_data}"
+                            "Failed to process incident prediction for %s",
+                            incident.parsed_data,
                         )
                     incident_list.append(processed)
                 return PipelineOutput(
@@ -180,7 +141,7 @@ class AnalysisOrchestrator:
                 incident = await self._process_incident_prediction(prediction, source)
                 if not incident:
                     logger.error(
-                        f"Failed to process incident prediction for {source.id}"
+                        "Failed to process incident prediction for %s", source.id
                     )
                     return PipelineOutput(
                         status=PipelineResult.FAILED_FORMATTING,
@@ -188,7 +149,7 @@ class AnalysisOrchestrator:
                         error_message="Failed to format incident report",
                     )
 
-                logger.info(f"Successfully created incident report for {source.id}")
+                logger.info("Successfully created incident report for %s", source.id)
                 return PipelineOutput(
                     status=PipelineResult.SUCCESS,
                     source=source,
@@ -201,7 +162,7 @@ class AnalysisOrchestrator:
                 "exception_message": str(e),
                 "traceback": traceback.format_exc(),
             }
-            logger.error(f"Error processing prediction: {error_details}")
+            logger.error("Error processing prediction: %s", error_details)
 
             return PipelineOutput(
                 status=PipelineResult.FAILED_FORMATTING,
@@ -215,14 +176,14 @@ class AnalysisOrchestrator:
         """Process incident prediction into IncidentReport"""
         try:
             # Format the raw prediction into a structured report
-            logger.info(f"Formatting report from source: {source.url}")
+            logger.info("Formatting report from source: %s", source.url)
             incident = format_report(prediction)
             if not incident:
-                logger.error(f"Failed to format prediction into incident report")
+                logger.error("Failed to format prediction into incident report")
                 return None
 
             return incident
 
         except Exception as e:
-            logger.error(f"Error processing incident prediction: {e}")
+            logger.error("Error processing incident prediction: %s", e)
             return None
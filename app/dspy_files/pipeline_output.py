@@ -0,0 +1,46 @@
+from __future__ import annotations
+from enum import Enum
+from typing import List
+
+from pydantic import BaseModel, Field
+from app.models.articles import Source
+from app.models.incidents import IncidentReport, IndustryOverview
+
+
+class PipelineResult(Enum):
+    """Enum for pipeline result status"""
+
+    SUCCESS = "success"
+    INVALID_INPUT = "invalid_input"
+    FAILED_EXTRACTION = "failed_extraction"
+    FAILED_CLASSIFICATION = "failed_classification"
+    FAILED_ANALYSIS = "failed_analysis"
+    FAILED_FORMATTING = "failed_formatting"
+    UNRELATED_CONTENT = "unrelated_content"
+    DUPLICATE_HASHED_TEXT = "duplicate_hashed_text"
+
+
+class PipelineOutput(BaseModel):
+    """Structured output from the pipeline"""
+
+    status: PipelineResult
+    source: Source | None = None
+    incidents: List[IncidentReport] = Field(default_factory=list)
+    industry_overview: IndustryOverview | None = None
+    error_message: str | None = None
+
+    @property
+    def is_success(self) -> bool:
+        return self.status == PipelineResult.SUCCESS
+
+    @property
+    def is_unrelated(self) -> bool:
+        return self.status == PipelineResult.UNRELATED_CONTENT
+
+    @property
+    def has_incident(self) -> bool:
+        return len(self.incidents) != 0
+
+    @property
+    def has_overview(self) -> bool:
+        return self.industry_overview is not None
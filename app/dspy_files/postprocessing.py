@@ -6,29 +6,17 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def _convert_to_dict(obj):
-    """Helper to convert Pydantic models to dictionaries."""
-    if hasattr(obj, "model_dump"):
-        return obj.model_dump()
-    if hasattr(obj, "dict"):
-        return obj.dict()
-    return obj
-
-
 def format_report(prediction: dspy.Prediction) -> IncidentReport | None:
     """Formats a dspy.Prediction object into a structured IncidentReport."""
     if not prediction:
         return None
 
-    report_data = {
-        "extracted_information": _convert_to_dict(
-            getattr(prediction, "parsed_data", None)
-        ),
-        "incident_classification": _convert_to_dict(
-            getattr(prediction, "incident_classification", None)
-        ),
-    }
-    return IncidentReport(**report_data)
+    # The signature outputs are already validated models; passing them through
+    # as-is avoids dumping and re-validating every nested sub-model.
+    return IncidentReport(
+        extracted_information=getattr(prediction, "parsed_data", None),
+        incident_classification=getattr(prediction, "incident_classification", None),
+    )
 
 
 def verify_species_in_report(report: IncidentReport) -> IncidentReport:
@@ -60,9 +48,9 @@ def verify_species_in_report(report: IncidentReport) -> IncidentReport:
         try:
             is_verified = fn.verify_sci_name(common_name, sci_name)
             species["verified"] = is_verified
-            logger.info(f"Verified {common_name} -> {sci_name}: {is_verified}")
+            logger.info("Verified %s -> %s: %s", common_name, sci_name, is_verified)
         except Exception as e:
-            logger.error(f"Could not verify {common_name}: {e}")
+            logger.error("Could not verify %s: %s", common_name, e)
             species["verified"] = False
 
     return report
@@ -1,4 +1,6 @@
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import requests
 from bs4 import BeautifulSoup, Comment, Tag
@@ -7,10 +9,17 @@ import dspy
 from app.dspy_files.signatures import CleanArticleContent
 from app.models.articles import Source
 from app.dspy_files.config import setup_dspy
+from app.dspy_files.external_apis import create_http_session
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Page fetches block on the network and parsing holds the GIL, so both run
+# here rather than on the event loop; sized for I/O-bound work
+_fetch_executor = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4), thread_name_prefix="page-fetch"
+)
+
 
 class ContentFilter:
     """
@@ -90,10 +99,10 @@ class ContentFilter:
         self, stage_name: str, soup: BeautifulSoup, last_successful_html: str, action
     ) -> str:
         """Helper to run a filtering stage and check the result."""
-        logger.info(f"Running Stage: {stage_name}...")
+        logger.info("Running Stage: %s...", stage_name)
         action(soup)
         if len(soup.get_text(strip=True)) < self.MIN_CONTENT_LENGTH:
-            logger.info(f"Stage '{stage_name}' removed too much content. Reverting.")
+            logger.info("Stage '%s' removed too much content. Reverting.", stage_name)
             return last_successful_html
         return str(soup)
 
@@ -182,8 +191,9 @@ class ContentFilter:
 class WebScraper:
     """Simple web scraper with proper headers"""
 
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, session: requests.Session | None = None):
         self.timeout = timeout
+        self.session = session or create_http_session()
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
@@ -191,7 +201,9 @@ class WebScraper:
     def fetch_page(self, url: str) -> BeautifulSoup:
         """Fetch and parse webpage"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(
+                url, headers=self.headers, timeout=self.timeout
+            )
             response.raise_for_status()
             return BeautifulSoup(response.content, "html.parser")
         except requests.RequestException as e:
@@ -201,8 +213,13 @@ class WebScraper:
 class ArticleExtractionPipeline:
     """Flexible pipeline: URL -> Filtered HTML -> Clean Text"""
 
-    def __init__(self, model="openai/gpt-4o-mini", api_key: str = None):
-        self.scraper = WebScraper()
+    def __init__(
+        self,
+        model="openai/gpt-4o-mini",
+        api_key: str = None,
+        session: requests.Session | None = None,
+    ):
+        self.scraper = WebScraper(session=session)
         self.filter = ContentFilter()
 
         self.lm = setup_dspy(model=model, api_key=api_key)
@@ -231,26 +248,31 @@ class ArticleExtractionPipeline:
                     return title
         return None
 
+    def _fetch_and_filter(self, url: str) -> tuple[str | None, str | None]:
+        """Blocking steps of the pipeline: fetch, title extraction, filtering"""
+        # Step 1: Fetch the webpage
+        logger.debug("Fetching: %s", url)
+        soup = self.scraper.fetch_page(url)
+
+        # Step 2: Extract title
+        title = self.extract_title(soup)
+        logger.debug("Title: %s", title)
+
+        # Step 3: Filter content to textual HTML
+        return title, self.filter.filter_content(soup)
+
     async def process_url(self, url: str) -> Source:
         """Main pipeline: URL -> Filtered HTML -> Clean Text"""
 
         try:
-            # Step 1: Fetch the webpage
-            logger.info(f"Fetching: {url}")
-            soup = self.scraper.fetch_page(url)
-
-            # Step 2: Extract title
-            title = self.extract_title(soup)
-            logger.info(f"Title: {title}")
-
-            # Step 3: Filter content to textual HTML
-            print("Filtering content...")
-            filtered_html = self.filter.filter_content(soup)
+            title, filtered_html = await asyncio.get_running_loop().run_in_executor(
+                _fetch_executor, self._fetch_and_filter, url
+            )
 
             if not filtered_html:
                 raise ValueError("Could not extract meaningful content after filtering")
 
-            print(f"Filtered HTML length: {len(filtered_html)} characters")
+            logger.debug("Filtered HTML length: %d characters", len(filtered_html))
             # Step 4: Use DSPy to clean the filtered HTML into readable text
             clean_content = filtered_html  # Fallback
 
@@ -261,7 +283,7 @@ class ArticleExtractionPipeline:
                 result.article_title = title
                 logger.info("DSPy processing complete")
             except Exception as e:
-                logger.warning(f"DSPy processing failed, using filtered HTML: {e}")
+                logger.warning("DSPy processing failed, using filtered HTML: %s", e)
                 # Convert HTML to text as fallback
                 fallback_soup = BeautifulSoup(filtered_html, "html.parser")
                 clean_content = fallback_soup.get_text(separator="\n\n", strip=True)
@@ -281,12 +303,12 @@ class ArticleExtractionPipeline:
         results = []
 
         for i, url in enumerate(urls, 1):
-            logger.info(f"\n--- Processing {i}/{len(urls)} ---")
+            logger.info("\n--- Processing %s/%s ---", i, len(urls))
             try:
                 article = self.process_url(url)
                 results.append(article)
             except Exception as e:
-                logger.error(f"Failed to process {url}: {e}")
+                logger.error("Failed to process %s: %s", url, e)
 
         return results
 
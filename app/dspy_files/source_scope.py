@@ -17,15 +17,17 @@ class SourceScope:
         try:
             if source.article_scope:
                 logger.info(
-                    f"Article from '{source.url}' already classified as: {source.article_scope.articleType}"
+                    "Article from '%s' already classified as: %s",
+                    source.url,
+                    source.article_scope.articleType,
                 )
                 return source
 
             classification_pred = await self.classification_tool.acall(source=source)
             source.article_scope = classification_pred.classification
 
-            logger.info(f"Article classified as: {source.article_scope.articleType} ")
+            logger.info("Article classified as: %s ", source.article_scope.articleType)
             return source
         except Exception as e:
-            logger.error(f"Error during source pipeline for '{source.url}': {e}")
+            logger.error("Error during source pipeline for '%s': %s", source.url, e)
             raise
@@ -1,21 +1,50 @@
+import asyncio
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
+from beanie import PydanticObjectId
 from fastapi import File, HTTPException, status
-from app.models.incidents import IncidentReport, IndustryOverview
+from app.models.articles import Source
+from app.models.incidents import INCIDENT_ADAPTER, IncidentReport, IndustryOverview
 from pymongo.errors import DuplicateKeyError
 from app.models.logs import LogContext
-from app.dspy_files.news_analysis import (
-    AnalysisOrchestrator,
-    PipelineOutput,
-    PipelineResult,
-)
+from typing import TYPE_CHECKING, List
+from app.dspy_files.pipeline_output import PipelineOutput, PipelineResult
 import logging
-from app.dspy_files.content_extraction import ContentExtractor
+import requests
+
+if TYPE_CHECKING:
+    # DSPy and the extraction stack are heavy; only analysis paths import them
+    from app.dspy_files.news_analysis import AnalysisOrchestrator
 
 logger = logging.getLogger(__name__)
 
+# Shared across requests so the scraper's connection pool and the DSPy LM are
+# built once per worker instead of once per analysis.
+_http_session: requests.Session | None = None
+_orchestrator: "AnalysisOrchestrator | None" = None
+
+# Analyses currently running per URL; concurrent submissions share one result
+_inflight: dict[str, asyncio.Task] = {}
+
+# Analyses running at once, each making several upstream LLM calls; the rest
+# wait here instead of piling onto the API and timing out together
+_MAX_CONCURRENT_ANALYSES = 8
+_analysis_slots = asyncio.Semaphore(_MAX_CONCURRENT_ANALYSES)
+
+# PDF text extraction and OCR, at most one job per core at a time
+_pdf_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="pdf-extract"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _valid_fields(model_class) -> frozenset[str]:
+    return frozenset(model_class.model_fields)
+
 
 def _filter_valid_fields(model_class, updates: dict) -> dict:
-    valid_fields = set(model_class.model_fields.keys())
+    valid_fields = _valid_fields(model_class)
     return {k: v for k, v in updates.items() if k in valid_fields}
 
 
@@ -27,14 +56,14 @@ class IncidentService:
     @staticmethod
     async def _create_report(output: PipelineOutput) -> PipelineResult:
         if output.status == PipelineResult.DUPLICATE_HASHED_TEXT:
-            logger.info(f"Text already exists in db: {output.source.id}")
+            logger.info("Text already exists in db: %s", output.source.id)
             return output
 
         source = output.source
 
         if not source:
-            logger.error(f"Analysis failed to produce a source")
-            logger.error(f"Pipeline status {output.status}: {output.error_message}")
+            logger.error("Analysis failed to produce a source")
+            logger.error("Pipeline status %s: %s", output.status, output.error_message)
 
             return output
 
@@ -44,75 +73,142 @@ class IncidentService:
 
             if not output.has_incident and not output.has_overview:
                 logger.error(
-                    f"Analysis failed to produce a report for source: {source.id}"
+                    "Analysis failed to produce a report for source: %s", source.id
+                )
+                logger.error(
+                    "Pipeline status %s: %s", output.status, output.error_message
                 )
-                logger.error(f"Pipeline status {output.status}: {output.error_message}")
                 return output
 
             if not output.is_success:
                 logger.error(
-                    f"Analysis failed for source {source.id} with status {output.status}"
+                    "Analysis failed for source %s with status %s",
+                    source.id,
+                    output.status,
                 )
                 raise HTTPException(
                     status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                     detail=f"Analysis failed with status: {output.status}: {output.error_message or 'No error message provided'}",
                 )
 
+            # Assign ids up front so the links between source, incidents and
+            # overview are written with the initial inserts, not follow-up saves
+            if source.id is None:
+                source.id = PydanticObjectId()
+
             if output.has_incident:
-                saved_incidents = []
                 for incident in incidents:
-                    try:
-                        await incident.insert()
-                        logger.info(
-                            f"Successfully saved incident report: {incident.id}"
-                        )
-                        saved_incidents.append(incident)
-                    except Exception as e:
-                        logger.error(
-                            f"Database save failed for report {incident.id}: {e}"
-                        )
-                        raise e
-                source.incidents = saved_incidents
-                output.incidents = saved_incidents
+                    if incident.id is None:
+                        incident.id = PydanticObjectId()
+                    incident.sources.append(source)
+                    if incident.primary_source is None:
+                        incident.primary_source = source
+                source.incidents = incidents
             if output.has_overview and industry:
-                try:
-                    await industry.insert()
-                    logger.info(f"Successfully saved industry report: {industry.id}")
-                    source.overview = industry
-                except Exception as e:
-                    logger.error(
-                        f"Database save failed for industry report {industry.id}: {e}"
-                    )
-                    raise e
+                if industry.id is None:
+                    industry.id = PydanticObjectId()
+                industry.source = source
+                source.overview = industry
 
         try:
             await source.insert()
-            logger.info(f"Successfully saved source: {source.id}")
+            logger.info("Successfully saved source: %s", source.id)
+        except DuplicateKeyError:
+            # Lost a race with a concurrent submission of the same url or text
+            logger.info("Source already exists for %s", source.url or source.id)
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Source already exists for {source.url or 'this text'}",
+            )
         except Exception as e:
-            logger.error(f"Database save failed for {source.id}: {e}")
+            logger.error("Database save failed for %s: %s", source.id, e)
             raise e
 
         if output.status == PipelineResult.UNRELATED_CONTENT:
-            logger.info(f"Source {source.id} unrelated to IUU fishing")
+            logger.info("Source %s unrelated to IUU fishing", source.id)
             return output
 
+        # Ids and links were assigned up front, so the report and overview
+        # writes do not depend on each other and can share one round trip
+        saves = []
         if output.has_incident:
-            for incident in output.incidents:
-                if incident.primary_source is None:
-                    await incident.add_source(source, is_primary=True)
-                else:
-                    await incident.add_source(source, is_primary=False)
-
-        if output.has_overview and industry and hasattr(industry, "source"):
-            industry.source = source
-            await industry.save()
+            saves.append(IncidentService._save_incidents(source, incidents))
+        if output.has_overview and industry:
+            saves.append(IncidentService._save_overview(industry))
+        errors = [
+            result
+            for result in await asyncio.gather(*saves, return_exceptions=True)
+            if isinstance(result, BaseException)
+        ]
+        if errors:
+            # A source left behind would link to missing reports and make every
+            # retry of the same url a 409, so undo whatever was written
+            await IncidentService._discard_partial_report(source, output)
+            raise errors[0]
 
         return output
 
     @staticmethod
-    def _get_orchestrator() -> AnalysisOrchestrator:
-        api = os.getenv("OPENAI_API_KEY")
-        return AnalysisOrchestrator(api_key=api)
+    async def _discard_partial_report(source: Source, output: PipelineOutput) -> None:
+        """Delete the source and any reports or overview saved for it"""
+        try:
+            if output.has_incident:
+                await IncidentReport.get_pymongo_collection().delete_many(
+                    {"_id": {"$in": [incident.id for incident in output.incidents]}}
+                )
+            if output.has_overview and output.industry_overview:
+                await IndustryOverview.get_pymongo_collection().delete_one(
+                    {"_id": output.industry_overview.id}
+                )
+            await Source.get_pymongo_collection().delete_one({"_id": source.id})
+            logger.info("Removed partially saved source %s", source.id)
+        except Exception as e:
+            logger.error("Cleanup failed for source %s: %s", source.id, e)
+
+    @staticmethod
+    async def _save_incidents(source: Source, incidents: List[IncidentReport]) -> None:
+        try:
+            await IncidentReport.bulk_create(incidents)
+            logger.info(
+                "Successfully saved %d incident reports for source %s",
+                len(incidents),
+                source.id,
+            )
+        except Exception as e:
+            logger.error(
+                "Database save failed for reports of source %s: %s", source.id, e
+            )
+            raise e
+
+    @staticmethod
+    async def _save_overview(industry: IndustryOverview) -> None:
+        try:
+            await industry.insert()
+            logger.info("Successfully saved industry report: %s", industry.id)
+        except Exception as e:
+            logger.error(
+                "Database save failed for industry report %s: %s",
+                industry.id,
+                e,
+            )
+            raise e
+
+    @staticmethod
+    def set_http_session(session: requests.Session | None) -> None:
+        """Use the application's pooled HTTP session for all analyses."""
+        global _http_session, _orchestrator
+        _http_session = session
+        _orchestrator = None
+
+    @staticmethod
+    def _get_orchestrator() -> "AnalysisOrchestrator":
+        global _orchestrator
+        if _orchestrator is None:
+            from app.dspy_files.news_analysis import AnalysisOrchestrator
+
+            api = os.getenv("OPENAI_API_KEY")
+            _orchestrator = AnalysisOrchestrator(api_key=api, session=_http_session)
+        return _orchestrator
 
     @staticmethod
     async def create_report_from_url(url: str) -> PipelineOutput:
@@ -122,18 +218,32 @@ class IncidentService:
         #     source=context_data.get("source"),
         # )
 
-        logger.info(f"Starting analysis for URL: {url}")
+        task = _inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(IncidentService._analyze_url(url))
+            _inflight[url] = task
+            task.add_done_callback(lambda _: _inflight.pop(url, None))
+        else:
+            logger.info("Joining in-flight analysis for URL: %s", url)
+
+        # Shielded so one caller disconnecting does not cancel the others' work
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _analyze_url(url: str) -> PipelineOutput:
+        logger.info("Starting analysis for URL: %s", url)
 
         orchestrator = IncidentService._get_orchestrator()
 
-        output = await orchestrator.run_full_analysis_from_url(url=url)
+        async with _analysis_slots:
+            output = await orchestrator.run_full_analysis_from_url(url=url)
 
         results = await IncidentService._create_report(output)
         return results
 
     @staticmethod
     async def create_report_from_pdf(
-        pdf_bytes: bytes, filename: str = "", context_data: dict = {}
+        pdf: bytes | str, filename: str = "", context_data: dict = {}
     ) -> PipelineResult:
         # context = LogContext(
         #     user_id=context_data.get("acting_user_id"),
@@ -141,10 +251,18 @@ class IncidentService:
         #     source=context_data.get("source"),
         # )
 
-        logger.info(f"Starting analysis for file: {filename}")
-        source = ContentExtractor.from_pdf(pdf_bytes)
+        from app.dspy_files.content_extraction import ContentExtractor
+
+        logger.info("Starting analysis for file: %s", filename)
+        # Parsing/OCR is blocking CPU and subprocess work; keep it off the loop
+        # in its own bounded pool so large uploads cannot occupy every thread
+        # of the default executor
+        source = await asyncio.get_running_loop().run_in_executor(
+            _pdf_executor, ContentExtractor.from_pdf, pdf
+        )
         orchestrator = IncidentService._get_orchestrator()
-        output = await orchestrator.analysis_from_source(source=source)
+        async with _analysis_slots:
+            output = await orchestrator.analysis_from_source(source=source)
 
         results = await IncidentService._create_report(output=output)
 
@@ -152,9 +270,10 @@ class IncidentService:
 
     @staticmethod
     async def create_report_from_text(text: str) -> PipelineResult:
-        logger.info(f"Starting analysis for text: {text[:50]}")
+        logger.info("Starting analysis for text: %s", text[:50])
         orchestrator = IncidentService._get_orchestrator()
-        output = await orchestrator.run_full_analysis_from_text(text=text)
+        async with _analysis_slots:
+            output = await orchestrator.run_full_analysis_from_text(text=text)
 
         results = await IncidentService._create_report(output)
         return results
@@ -167,7 +286,7 @@ class IncidentService:
         #     source=context_data.get("source"),
         # )
 
-        logger.info(f"Updating report {report_id} with data: {update_data}")
+        logger.info("Updating report %s with data: %s", report_id, update_data)
 
         report = await IncidentReport.get(report_id)
         if not report:
@@ -178,6 +297,11 @@ class IncidentService:
 
         # report.set_log_context(context)
         updates = _filter_valid_fields(IncidentReport, update_data)
+        if isinstance(updates.get("extracted_information"), dict):
+            # setattr does not validate, so rebuild the nested model explicitly
+            updates["extracted_information"] = INCIDENT_ADAPTER.validate_python(
+                updates["extracted_information"]
+            )
         for field, value in updates.items():
             setattr(report, field, value)
 
@@ -185,9 +309,9 @@ class IncidentService:
 
         try:
             await report.save()
-            logger.info(f"Successfully updated report {report_id}")
+            logger.info("Successfully updated report %s", report_id)
         except Exception as e:
-            logger.error(f"Update failed for report {report_id}: {e}")
+            logger.error("Update failed for report %s: %s", report_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to update the report.",
@@ -203,7 +327,7 @@ class IncidentService:
         #     source=context_data.get("source"),
         # )
 
-        logger.info(f"Deleting report {report_id}")
+        logger.info("Deleting report %s", report_id)
 
         report = await IncidentReport.get(report_id)
         if not report:
@@ -216,9 +340,9 @@ class IncidentService:
 
         try:
             await report.delete()
-            logger.info(f"Successfully deleted report {report_id}")
+            logger.info("Successfully deleted report %s", report_id)
         except Exception as e:
-            logger.error(f"Deletion failed for report {report_id}: {e}")
+            logger.error("Deletion failed for report %s: %s", report_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to delete the report.",
@@ -1,8 +1,11 @@
-from typing import Literal
-from pydantic import BaseModel, Field, model_validator
+from enum import Enum
+from beanie import PydanticObjectId
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class GenRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     url: str | None = None
     text: str | None = None
     title: str | None = None
@@ -14,26 +17,49 @@ class GenRequest(BaseModel):
         return self
 
 
+class SourceTypeFilter(str, Enum):
+    ALL = "all"
+    URL = "url"
+    TEXT_UPLOAD = "text_upload"
+    PDF = "pdf"
+
+
+class VerifiedFilter(str, Enum):
+    ALL = "all"
+    TRUE = "true"
+    FALSE = "false"
+
+
+class StatusFilter(str, Enum):
+    ALL = "all"
+    EXTRACTED = "extracted"
+    USER_INPUT = "user_input"
+    MODIFIED = "modified"
+
+
+class IUUTypeFilter(str, Enum):
+    ILLEGAL_FISHING = "Illegal Fishing"
+    ILLEGAL_FISHING_ASSOCIATED_ACTIVITIES = "Illegal Fishing Associated Activities"
+    UNREPORTED_CATCH = "Unreported Catch"
+    UNREPORTED_CATCH_ASSOCIATED_ACTIVITIES = "Unreported Catch Associated Activities"
+    UNREGULATED_ACTORS = "Unregulated Actors"
+    UNREGULATED_AREAS_OR_STOCKS = "Unregulated Areas or Stocks"
+    SEAFOOD_FRAUD_OR_MISLABELING = "Seafood Fraud or Mislabeling"
+    FORCED_LABOR_OR_LABOR_ABUSE = "Forced Labor or Labor Abuse"
+    CIRCUMVENTING_PROHIBITIONS_OR_SANCTIONS = "Circumventing Prohibitions or Sanctions"
+    ILLEGAL_AQUACULTURAL_PRACTICES = "Illegal Aquacultural Practices"
+    OTHER = "Other"
+    ALL = "all"
+
+
 class IncidentFilters(BaseModel):
     limit: int = Field(default=25, gt=0, le=25)
     skip: int = Field(default=0, ge=0)
-    sort_by: Literal["created_at", "modified_at", "event_date"] = Field(
-        default="event_date"
+    after: PydanticObjectId | None = Field(
+        default=None,
+        description="Id of the last report on the previous page; replaces skip",
     )
-    source_type: Literal["all", "url", "text_upload", "pdf"] = Field(default="all")
-    verified: Literal["all", "true", "false"] = Field(default="all")
-    status: Literal["all", "extracted", "user_input", "modified"] = Field(default="all")
-    IUU_type: Literal[
-        "Illegal Fishing",
-        "Illegal Fishing Associated Activities",
-        "Unreported Catch",
-        "Unreported Catch Associated Activities",
-        "Unregulated Actors",
-        "Unregulated Areas or Stocks",
-        "Seafood Fraud or Mislabeling",
-        "Forced Labor or Labor Abuse",
-        "Circumventing Prohibitions or Sanctions",
-        "Illegal Aquacultural Practices",
-        "Other",
-        "all",
-    ] = Field(default="all")
+    source_type: SourceTypeFilter = Field(default=SourceTypeFilter.ALL)
+    verified: VerifiedFilter = Field(default=VerifiedFilter.ALL)
+    status: StatusFilter = Field(default=StatusFilter.ALL)
+    IUU_type: IUUTypeFilter = Field(default=IUUTypeFilter.ALL)
@@ -4,6 +4,10 @@ from datetime import datetime
 
 
 def setup_logging():
+    # Idempotent: a second call (reload, extra worker import) must not stack handlers
+    if logging.getLogger().handlers:
+        return
+
     import os
 
     os.makedirs("logs", exist_ok=True)
@@ -20,6 +24,3 @@ def setup_logging():
             logging.StreamHandler(sys.stdout),
         ],
     )
-
-
-setup_logging()
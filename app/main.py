@@ -4,6 +4,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.logging import setup_logging
 from app.database import init_db
+from app.dspy_files.external_apis import create_http_session
+from app.incident_service import IncidentService
+from app.middleware import ContentTypeGate
+from app.responses import ORJSONResponse
 from app.routes import router
 import logging
 
@@ -16,15 +20,19 @@ async def lifespan(app: FastAPI):
     Handles application startup events.
     Connects to the database before the app starts receiving requests.
     """
-    await init_db()
+    # Runs once per worker process
+    setup_logging()
+    app.state.mongo = await init_db()
+    app.state.http_session = create_http_session()
+    IncidentService.set_http_session(app.state.http_session)
     logger.info("Application startup complete. Database connected.")
     yield
-    # You can add shutdown logic here if needed
+    IncidentService.set_http_session(None)
+    app.state.http_session.close()
+    await app.state.mongo.close()
     logger.info("Application shutdown.")
 
 
-# Configure logging
-setup_logging()
 frontendPort = os.getenv("FRONTEND_PORT", "4000")
 origins = [
     "http://localhost",
@@ -36,8 +44,10 @@ origins = [
 ]
 
 # Create the FastAPI app instance at module level
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.include_router(router, prefix="/api", tags=["api"])
+# Added before CORS so CORS stays outermost and its headers reach 415 replies
+app.add_middleware(ContentTypeGate, paths=frozenset({"/api/incidents"}))
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -58,4 +68,12 @@ async def read_root():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # "auto" loop/http pick uvloop and httptools when installed (not on Windows)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        workers=int(os.getenv("WEB_CONCURRENCY", "4")),
+    )
@@ -0,0 +1,57 @@
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+ALLOWED_SUBMISSION_TYPES = frozenset({b"application/json", b"multipart/form-data"})
+
+
+class ContentTypeGate:
+    """
+    Rejects POSTs with an unsupported Content-Type to the given paths with a
+    415 before routing, request parsing or dependency injection run.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: frozenset[str],
+        allowed: frozenset[bytes] = ALLOWED_SUBMISSION_TYPES,
+    ) -> None:
+        self.app = app
+        self.paths = paths
+        self.allowed = allowed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"].rstrip("/") not in self.paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        content_type = b""
+        for name, value in scope["headers"]:
+            if name == b"content-type":
+                content_type = value
+                break
+        media_type = content_type.partition(b";")[0].strip().lower()
+        if media_type in self.allowed:
+            await self.app(scope, receive, send)
+            return
+
+        detail = (
+            f"Unsupported Content-Type: {content_type.decode('latin-1') or None}. "
+            "Must be 'application/json' or 'multipart/form-data'"
+        )
+        body = orjson.dumps({"detail": detail})
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 415,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
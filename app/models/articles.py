@@ -1,18 +1,26 @@
 from __future__ import annotations
 from datetime import datetime
 from typing import List, Literal
-from beanie import Document, Insert, Link, Replace, before_event
+from beanie import Document, Insert, Link, PydanticObjectId, Replace, before_event
 from bson import ObjectId
 from pydantic import BaseModel, Field, HttpUrl, model_validator
+import codecs
 import hashlib
 from pymongo import ASCENDING, DESCENDING, IndexModel
-from app.models.incidents import IndustryOverview
 from app.models.logs import LogMixin
-from typing import TYPE_CHECKING
 
 
-if TYPE_CHECKING:
-    from app.models.incidents import IncidentReport
+_HASH_CHUNK_CHARS = 64 * 1024
+
+
+def _hash_text(text: str) -> str:
+    """SHA-256 of the UTF-8 text, encoded in chunks to avoid a full-size copy"""
+    hasher = hashlib.sha256()
+    encoder = codecs.getincrementalencoder("utf-8")()
+    for start in range(0, len(text), _HASH_CHUNK_CHARS):
+        hasher.update(encoder.encode(text[start : start + _HASH_CHUNK_CHARS]))
+    hasher.update(encoder.encode("", final=True))
+    return hasher.hexdigest()
 
 
 class ArticleData(BaseModel):
@@ -95,19 +103,37 @@ class Source(Document):
                 unique=True,
                 partialFilterExpression={"url": {"$type": "string"}},
             ),
-            IndexModel([("article_text", "text")]),
+            IndexModel([("category", ASCENDING)]),
         ]
 
     @model_validator(mode="after")
     def generate_hash_on_creation(self):
         """Generate article hash after model creation"""
         if not self.article_hash and self.article_text:
-            self.article_hash = hashlib.sha256(self.article_text.encode()).hexdigest()
+            self.article_hash = _hash_text(self.article_text)
         return self
 
     @before_event([Insert, Replace])
     def generate_hash(self):
         """Generate article hash before saving"""
         if self.article_text:
-            self.article_hash = hashlib.sha256(self.article_text.encode()).hexdigest()
+            self.article_hash = _hash_text(self.article_text)
         # self.updated_at = datetime.utcnow()
+
+
+class SourceListing(BaseModel):
+    """Projection of a source for list views, without its article text"""
+
+    id: PydanticObjectId = Field(alias="_id")
+    url: str | None = None
+    article_title: str | None = None
+    article_scope: ArticleScopeClassification | None = None
+    author: str | None = None
+    publisher: str | None = None
+    publication_date: datetime | None = None
+    category: Literal["url", "text_upload", "pdf", "academic"] = "url"
+    status: Literal["extracted", "user_input", "modified"] = "extracted"
+
+
+# Imported last to close the Source <-> IncidentReport/IndustryOverview link cycle
+from app.models.incidents import IncidentReport, IndustryOverview  # noqa: E402
@@ -1,14 +1,17 @@
 from __future__ import annotations
+import asyncio
 import hashlib
-from typing import TYPE_CHECKING, List, Literal
-from beanie import Document, Insert, Link, Replace, before_event
+import sys
+from difflib import SequenceMatcher
+from typing import List, Literal, Type
+from beanie import Document, Link, PydanticObjectId
 from bson import ObjectId
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import OperationFailure
+from pymongo.operations import SearchIndexModel
 from app.models.logs import LogMixin
 
-if TYPE_CHECKING:
-    from app.models.articles import Source
-
 
 subtype_behavior = """
         - Illegal Fishing: 'Exceeding catch quotas', 'Keeping undersized fish', 'Catching unauthorized or prohibited species', 'Prohibited fishing gear', 'Fishing in closed areas or closed seasons'
@@ -24,10 +27,61 @@ subtype_behavior = """
         """
 
 
+VESSEL_NAME_PATH = "extracted_information.catchSourceInformation.vesselName"
+EVENT_LOCATION_PATH = "extracted_information.eventData.eventLocation"
+
+INCIDENT_DUPLICATE_SEARCH_INDEX_NAME = "incident_duplicate_search"
+INCIDENT_DUPLICATE_SEARCH_INDEX = SearchIndexModel(
+    name=INCIDENT_DUPLICATE_SEARCH_INDEX_NAME,
+    definition={
+        "mappings": {
+            "dynamic": False,
+            "fields": {
+                "extracted_information": {
+                    "type": "document",
+                    "fields": {
+                        "catchSourceInformation": {
+                            "type": "document",
+                            "fields": {"vesselName": {"type": "string"}},
+                        },
+                        "eventData": {
+                            "type": "document",
+                            "fields": {"eventLocation": {"type": "string"}},
+                        },
+                    },
+                }
+            },
+        }
+    },
+)
+
+
+def _link_id(item: Document | Link) -> ObjectId | None:
+    """Id of a linked document whether or not the link has been fetched"""
+    if isinstance(item, Link):
+        return item.ref.id
+    return item.id
+
+
+def _build_fingerprint_key(extracted: ExtractedIncidentData) -> bytes:
+    """Normalized vessel/date/location key identifying an incident"""
+    event = extracted.eventData
+    catch_source = extracted.catchSourceInformation
+    parts = (
+        (catch_source and catch_source.vesselName) or "default_vessel",
+        (event and event.eventDate) or "default_date",
+        (event and event.eventLocation) or "default_location",
+    )
+    # Unit separator rather than "_", which can appear inside the values
+    return b"\x1f".join(part.strip().lower().encode() for part in parts)
+
+
 # Pydantic models
 class Species(BaseModel):
     """Model to represent a single species involved in an incident."""
 
+    model_config = ConfigDict(frozen=True)
+
     speciesCommonName: str | None = Field(
         default=None,
         description="The common name of the species (e.g., 'Bluefin Tuna').",
@@ -56,6 +110,8 @@ class Species(BaseModel):
 class CrewMember(BaseModel):
     """Model to represent a crew member involved in an incident."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Name of the crew member.")
     nationality: str | None = Field(
         default=None, description="Nationality of the crew member, if available."
@@ -78,6 +134,8 @@ class CrewMember(BaseModel):
 
 
 class IUUClassification(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     IUUType: Literal[
         "Illegal Fishing",
         "Illegal Fishing Associated Activities",
@@ -109,6 +167,8 @@ class IUUClassification(BaseModel):
 class EventData(BaseModel):
     """Structured information about the primary event of an IUU incident. ie the event that triggered the article."""
 
+    model_config = ConfigDict(frozen=True)
+
     eventCategory: str = Field(
         ...,
         description="Categorize the primary event (e.g., 'Seizure', 'Arrest', 'Investigation Initiated', 'Fine Issued').",
@@ -125,10 +185,18 @@ class EventData(BaseModel):
         description="What was the outcome or resolution, if mentioned? (e.g., 'Vessel Detained', 'Crew Fined $10,000', 'Charges Dropped').",
     )
 
+    @field_validator("eventCategory", mode="before")
+    @classmethod
+    def intern_category(cls, value):
+        """Categories repeat across incidents, so share one string per value"""
+        return sys.intern(value) if isinstance(value, str) else value
+
 
 class CatchSourceData(BaseModel):
     """The structured information extracted from an article about catch and source of an incident."""
 
+    model_config = ConfigDict(frozen=True)
+
     # Who
     vesselName: str | None = Field(
         default=None, description="Name of the vessel involved"
@@ -297,6 +365,8 @@ class CatchSourceData(BaseModel):
 class AquacultureData(BaseModel):
     """Model to represent aquaculture data in an IUU incident."""
 
+    model_config = ConfigDict(frozen=True)
+
     farmName: str | None = Field(
         default=None, description="Name of the aquaculture farm, if available"
     )
@@ -332,6 +402,8 @@ class AquacultureData(BaseModel):
 class TransshipmentData(BaseModel):
     """Model to represent transshipment data in an IUU incident."""
 
+    model_config = ConfigDict(frozen=True)
+
     vesselName: str | None = Field(
         default=None, description="Name of the transshipment vessel, if available"
     )
@@ -370,6 +442,8 @@ class TransshipmentData(BaseModel):
 class AggregationData(BaseModel):
     """Model to represent aggregation data in an IUU incident."""
 
+    model_config = ConfigDict(frozen=True)
+
     aggregatorName: str | None = Field(
         default=None,
         description="Name of the aggregator involved in the incident, if available",
@@ -386,6 +460,8 @@ class AggregationData(BaseModel):
 class LandingData(BaseModel):
     """Model to represent landing data in an IUU incident."""
 
+    model_config = ConfigDict(frozen=True)
+
     authorization: str | None = Field(
         default=None, description="Authorization for landing, if available"
     )
@@ -407,6 +483,8 @@ class LandingData(BaseModel):
 class ProductData(BaseModel):
     """Model to represent products in an IUU incident."""
 
+    model_config = ConfigDict(frozen=True)
+
     productType: str | None = Field(
         default=None, description="Type of product processed, if available"
     )
@@ -446,6 +524,8 @@ class ProductData(BaseModel):
 class TradeData(BaseModel):
     """Model to represent trade data in an IUU incident."""
 
+    model_config = ConfigDict(frozen=True)
+
     exporterInformation: str | None = Field(
         default=None, description="Information about the exporter, if available"
     )
@@ -457,6 +537,8 @@ class TradeData(BaseModel):
 class DistributionData(BaseModel):
     """Model to represent distribution data in an IUU incident."""
 
+    model_config = ConfigDict(frozen=True)
+
     firstBuyer: str | None = Field(
         default=None, description="Name of the first buyer, if available"
     )
@@ -556,6 +638,35 @@ class IndustryOverviewExtract(BaseModel):
     summary: str = Field(description="Summary of the industry overview article.")
 
 
+# Built once; re-parsing extracted data reuses the same validator
+INCIDENT_ADAPTER = TypeAdapter(ExtractedIncidentData)
+
+
+class _CandidateCatchSource(BaseModel):
+    vesselName: str | None = None
+
+
+class _CandidateExtract(BaseModel):
+    catchSourceInformation: _CandidateCatchSource | None = None
+    eventData: EventData | None = None
+
+
+class DuplicateCandidate(BaseModel):
+    """Projection of the fields needed to compare potential duplicate incidents"""
+
+    id: PydanticObjectId = Field(alias="_id")
+    incident_fingerprint: str | None = None
+    extracted_information: _CandidateExtract
+
+    class Settings:
+        projection = {
+            "_id": 1,
+            "incident_fingerprint": 1,
+            "extracted_information.catchSourceInformation.vesselName": 1,
+            "extracted_information.eventData": 1,
+        }
+
+
 class IndustryOverview(Document):
     """Model to represent an industry overview article."""
 
@@ -564,6 +675,8 @@ class IndustryOverview(Document):
 
     class Settings:
         name = "industry_overviews"
+        # Extracted data is mostly unset optionals; don't store them as nulls
+        keep_nulls = False
 
     async def delete(self):
         """Override delete method to handle source removal"""
@@ -605,79 +718,143 @@ class IncidentReport(Document):
 
     class Settings:
         name = "incidents"
+        keep_nulls = False
+        indexes = [
+            IndexModel([("incident_fingerprint", ASCENDING)]),
+            IndexModel(
+                [("incident_classification.iuuClassifications.IUUType", ASCENDING)]
+            ),
+            IndexModel([(VESSEL_NAME_PATH, ASCENDING)]),
+        ]
 
-    @before_event([Insert, Replace])
     def generate_fingerprint(self):
         """Generate incident fingerprint before saving"""
 
         if not self.incident_fingerprint:
-            eventData = self.extracted_information.eventData
-            catchSourceInfo = self.extracted_information.catchSourceInformation
+            self.incident_fingerprint = hashlib.blake2b(
+                _build_fingerprint_key(self.extracted_information), digest_size=16
+            ).hexdigest()
 
-            location = (
-                eventData.eventLocation
-                if eventData and eventData.eventLocation
-                else "default_location"
-            )
-            date = (
-                eventData.eventDate
-                if eventData and eventData.eventDate
-                else "default_date"
-            )
-            name = (
-                catchSourceInfo.vesselName
-                if catchSourceInfo and catchSourceInfo.vesselName
-                else "default_vessel"
-            )
+    async def insert(self, *args, **kwargs):
+        """Fingerprint on the write path only, without an event hook per save"""
+        self.generate_fingerprint()
+        return await super().insert(*args, **kwargs)
 
-            fingerprint_data = f"{name}_" f"{date}_" f"{location}"
-            self.incident_fingerprint = hashlib.sha256(
-                fingerprint_data.encode()
-            ).hexdigest()
+    @classmethod
+    async def bulk_create(
+        cls, items: List["IncidentReport"], batch_size: int = 500
+    ) -> None:
+        """Insert incident reports in unordered batches instead of one by one"""
+        # insert_many bypasses insert(), so fingerprint here as well
+        for item in items:
+            item.generate_fingerprint()
+        for start in range(0, len(items), batch_size):
+            await cls.insert_many(items[start : start + batch_size], ordered=False)
+
+    @classmethod
+    async def fetch_sources(
+        cls,
+        reports: List["IncidentReport"],
+        projection_model: Type[BaseModel] | None = None,
+    ) -> None:
+        """
+        Resolve the source links of many reports with a single $in query.
+        A projection_model limits which source fields are read.
+        """
+        source_ids = {_link_id(s) for report in reports for s in report.sources}
+        source_ids.update(
+            _link_id(report.primary_source)
+            for report in reports
+            if report.primary_source is not None
+        )
+        if not source_ids:
+            return
+
+        sources = await Source.find(
+            {"_id": {"$in": list(source_ids)}}, projection_model=projection_model
+        ).to_list()
+        found = {source.id: source for source in sources}
+        for report in reports:
+            report.sources = [found.get(_link_id(s), s) for s in report.sources]
+            if report.primary_source is not None:
+                report.primary_source = found.get(
+                    _link_id(report.primary_source), report.primary_source
+                )
 
     async def add_source(self, source: "Source", is_primary: bool = False):
         """Helper method to add a source and maintain bidirectional relationship"""
         try:
+            source_ref = source.to_ref()
+            incident_update = {"$addToSet": {"sources": source_ref}}
+            if is_primary:
+                incident_update["$set"] = {"primary_source": source_ref}
+
+            # Targeted updates on both sides instead of re-saving whole documents
+            await asyncio.gather(
+                IncidentReport.get_pymongo_collection().update_one(
+                    {"_id": self.id}, incident_update
+                ),
+                Source.get_pymongo_collection().update_one(
+                    {"_id": source.id}, {"$addToSet": {"incidents": self.to_ref()}}
+                ),
+            )
+
             if self.sources is None:
                 self.sources = []
-            source_ids = [s.id for s in self.sources if hasattr(s, "id")]
+            # $addToSet already keeps the stored arrays unique; these set
+            # lookups only keep the in-memory lists in step with it
+            source_ids = {_link_id(s) for s in self.sources}
             if source.id not in source_ids:
                 self.sources.append(source)
 
             if is_primary:
                 self.primary_source = source
 
-            await self.save()
-
-            incident_ids = [i.id for i in source.incidents if hasattr(i, "id")]
+            incident_ids = {_link_id(i) for i in source.incidents}
             if self.id not in incident_ids:
                 source.incidents.append(self)
-                await source.save()
 
         except Exception as e:
             raise Exception(f"Failed to add source to incident: {e}")
 
-    async def remove_source(self, source: "Source"):
+    async def remove_source(self, source: "Source | Link[Source]"):
         """Helper method to remove a source and maintain bidirectional relationship"""
         try:
-            self.sources = [s for s in self.sources if s.id != source.id]
+            source_id = _link_id(source)
+            self.sources = [s for s in self.sources if _link_id(s) != source_id]
 
-            if self.primary_source and self.primary_source.id == source.id:
+            incident_update = {"$pull": {"sources": {"$id": source_id}}}
+            if self.primary_source and _link_id(self.primary_source) == source_id:
                 self.primary_source = self.sources[0] if self.sources else None
+                incident_update["$set"] = {
+                    "primary_source": (
+                        self.primary_source.to_ref() if self.primary_source else None
+                    )
+                }
+
+            await asyncio.gather(
+                IncidentReport.get_pymongo_collection().update_one(
+                    {"_id": self.id}, incident_update
+                ),
+                Source.get_pymongo_collection().update_one(
+                    {"_id": source_id}, {"$pull": {"incidents": {"$id": self.id}}}
+                ),
+            )
 
-            if source.incidents:
-                source.incidents = [i for i in source.incidents if i.id != self.id]
-                await source.save()
-
-            await self.save()
+            if isinstance(source, Document) and source.incidents:
+                source.incidents = [
+                    i for i in source.incidents if _link_id(i) != self.id
+                ]
         except Exception as e:
             raise Exception(f"Failed to remove source from incident: {e}")
 
     async def delete(self):
         """Override delete method to handle source removal"""
         try:
-            for source in self.sources:
-                self.remove_source(source)
+            # One multi-update unlinks this incident from every source
+            await Source.get_pymongo_collection().update_many(
+                {"incidents.$id": self.id}, {"$pull": {"incidents": {"$id": self.id}}}
+            )
 
             self.sources = []
             self.primary_source = None
@@ -687,15 +864,67 @@ class IncidentReport(Document):
 
     @classmethod
     async def find_potential_duplicates(
-        cls, incident_data: "ExtractedIncidentData", threshold: float = 0.8
-    ):
-        # Could use vessel name, location proximity, date proximity, etc.
-        # TODO
+        cls,
+        incident_data: "ExtractedIncidentData",
+        threshold: float = 0.8,
+        limit: int = 50,
+    ) -> List[DuplicateCandidate]:
         """Find potential duplicate incidents based on similarity"""
         vessel_name = getattr(incident_data.catchSourceInformation, "vesselName", None)
-        if vessel_name:
-            return await cls.find(
-                cls.extracted_information.catchSourceInformation.vesselName
-                == vessel_name
+        if not vessel_name:
+            return []
+
+        # Fuzzy, index-served shortlist so spelling variants of a vessel name
+        # are still candidates; only the fields used for comparison are returned
+        search = {
+            "index": INCIDENT_DUPLICATE_SEARCH_INDEX_NAME,
+            "compound": {
+                "must": [
+                    {
+                        "text": {
+                            "query": vessel_name,
+                            "path": VESSEL_NAME_PATH,
+                            "fuzzy": {"maxEdits": 1},
+                        }
+                    }
+                ]
+            },
+        }
+        event_location = getattr(incident_data.eventData, "eventLocation", None)
+        if event_location:
+            search["compound"]["should"] = [
+                {"text": {"query": event_location, "path": EVENT_LOCATION_PATH}}
+            ]
+
+        try:
+            candidates = await cls.aggregate(
+                [{"$search": search}, {"$limit": limit}],
+                projection_model=DuplicateCandidate,
             ).to_list()
-        return []
+        except OperationFailure:
+            # No Atlas Search (e.g. a local mongod): exact match on the btree index
+            candidates = (
+                await cls.find(
+                    {VESSEL_NAME_PATH: vessel_name},
+                    projection_model=DuplicateCandidate,
+                )
+                .limit(limit)
+                .to_list()
+            )
+
+        # Score the shortlist on the same normalized key the fingerprint uses,
+        # so date and location differences lower the similarity
+        key = _build_fingerprint_key(incident_data)
+        matcher = SequenceMatcher(None, b"", key, autojunk=False)
+        duplicates = []
+        for candidate in candidates:
+            matcher.set_seq1(_build_fingerprint_key(candidate.extracted_information))
+            # quick_ratio is a cheap upper bound; skip the full diff below it
+            if matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold:
+                duplicates.append(candidate)
+        return duplicates
+
+
+# Imported last: Source links back to the documents above, so the cycle resolves
+# once both modules have defined their classes and the names are module globals
+from app.models.articles import Source  # noqa: E402
@@ -1,24 +1,32 @@
+import asyncio
+import logging
 from datetime import datetime, timezone
 from typing import Any
 from beanie import (
     Document,
+    Granularity,
     Insert,
     PydanticObjectId,
     Replace,
     SaveChanges,
+    TimeSeriesConfig,
     Delete,
     before_event,
     after_event,
 )
-from pydantic import BaseModel, Field
+from beanie.odm.utils.encoder import Encoder
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from pymongo import ASCENDING, DESCENDING, IndexModel, WriteConcern
 
 
 class LogContext(BaseModel):
-    user_id: str | None = Field(default=None)
+    model_config = ConfigDict(defer_build=True)
+
+    user_id: str | None = None
     action: str | None = Field(
         default=None, description="Name of action, e.g. new_report, edit_report"
     )
-    source: str | None = Field(default=None)
+    source: str | None = None
 
 
 class Log(Document):
@@ -27,91 +35,223 @@ class Log(Document):
     operation: str
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
-    changes: dict[str, dict[str, Any]] | None = Field(default=None)
-    before_state: dict[str, Any] | None = Field(default=None)
-    after_state: dict[str, Any] | None = Field(default=None)
+    changes: dict[str, dict[str, Any]] | None = None
+    before_state: dict[str, Any] | None = None
+    after_state: dict[str, Any] | None = None
 
-    context: LogContext | None = Field(default=None)
+    context: LogContext | None = None
 
     class Settings:
         name = "logs"
-        indexes = ["document_id", "collection_name", "timestamp", "context.user_id"]
+        # Append-only and time-ordered: stored as compressed time buckets.
+        # Only applies when Beanie creates the collection.
+        timeseries = TimeSeriesConfig(
+            time_field="timestamp",
+            meta_field="collection_name",
+            granularity=Granularity.seconds,
+        )
+        # Log lookups filter on one of these and read newest first
+        indexes = [
+            IndexModel([("document_id", ASCENDING), ("timestamp", DESCENDING)]),
+            IndexModel([("collection_name", ASCENDING), ("timestamp", DESCENDING)]),
+            IndexModel([("context.user_id", ASCENDING), ("timestamp", DESCENDING)]),
+        ]
+
+
+logger = logging.getLogger(__name__)
+
+LOG_BATCH_SIZE = 500
+LOG_FLUSH_INTERVAL = 0.1  # seconds
+
+# Encoded log documents waiting to be written; None tells the writer to stop
+_log_queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+_log_writer: asyncio.Task | None = None
+
+
+# Log documents are built by LogMixin itself, so they are encoded straight to
+# BSON-ready dicts rather than validated through the Log model first
+_log_encoder = Encoder(to_db=True)
+
+
+def _log_collection():
+    """
+    Logs collection with unacknowledged writes. Audit logs aren't
+    authoritative, so requests don't wait on the server; entries can be lost
+    if the server fails before writing them.
+    """
+    return Log.get_pymongo_collection().with_options(write_concern=WriteConcern(w=0))
+
+
+async def _write_log_batch(batch: list[dict[str, Any]]) -> None:
+    try:
+        await _log_collection().insert_many(batch, ordered=False)
+    except Exception as e:
+        logger.error("Failed to write %d log entries: %s", len(batch), e)
+
+
+async def _flush_logs() -> None:
+    """Write queued log entries in batches of LOG_BATCH_SIZE or every interval"""
+    loop = asyncio.get_running_loop()
+    while True:
+        entry = await _log_queue.get()
+        if entry is None:
+            return
+        batch = [entry]
+        deadline = loop.time() + LOG_FLUSH_INTERVAL
+        stop = False
+        while len(batch) < LOG_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                entry = await asyncio.wait_for(_log_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if entry is None:
+                stop = True
+                break
+            batch.append(entry)
+        await _write_log_batch(batch)
+        if stop:
+            return
+
+
+def start_log_writer() -> None:
+    """Start the background task that batches log writes"""
+    global _log_writer
+    if _log_writer is None:
+        _log_writer = asyncio.create_task(_flush_logs())
 
 
-class LogMixin:
+async def stop_log_writer() -> None:
+    """Flush everything queued so far and stop the writer"""
+    global _log_writer
+    if _log_writer is not None:
+        _log_queue.put_nowait(None)
+        await _log_writer
+        _log_writer = None
+
+
+async def _write_log(entry: dict[str, Any]) -> None:
+    if _log_writer is not None:
+        _log_queue.put_nowait(entry)
+    else:
+        # No writer running (e.g. scripts): write through
+        await _log_collection().insert_one(entry)
+
+
+class LogMixin(BaseModel):
     """Mixing to add loigging to Any given model"""
 
-    _log_context: LogContext | None = Field(default=None)
-    _original_state: dict[str, Any] = Field(default=None)
+    # Private attributes: never validated, serialized or stored
+    _log_context: LogContext | None = PrivateAttr(default=None)
+    _original_state: dict[str, Any] | None = PrivateAttr(default=None)
+    _original_values: dict[str, Any] = PrivateAttr(default_factory=dict)
+    _dirty_fields: set[str] = PrivateAttr(default_factory=set)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Track assigned fields so an update only dumps and diffs those. Mutating
+        # a field in place (e.g. list.append) isn't seen; reassign it instead.
+        if not name.startswith("_") and self.__pydantic_private__ is not None:
+            self._dirty_fields.add(name)
+        super().__setattr__(name, value)
 
     def set_log_context(self, context: LogContext) -> None:
-        """Set the log context for this operation"""
+        """
+        Set the log context for this operation. Call it before modifying the
+        document: the current state is snapshotted here so saving doesn't
+        need to re-read the stored document to diff against.
+        """
         self._log_context = context
+        if not self._original_state:
+            self._take_snapshot(self)
         return self
 
+    def _take_snapshot(self, doc: "LogMixin") -> None:
+        """Record the baseline that the next update is diffed against"""
+        self._original_state = doc.model_dump()
+        # Field objects as well, so unchanged fields are skipped without dumping
+        self._original_values = dict(doc)
+
+    def _log_document(self, operation: str, **fields: Any) -> dict[str, Any]:
+        """Encoded Log document for an operation on this document"""
+        return _log_encoder.encode(
+            {
+                "document_id": self.id,
+                "collection_name": self.__class__.Settings.name,
+                "operation": operation,
+                "timestamp": datetime.now(timezone.utc),
+                "changes": None,
+                "before_state": None,
+                "after_state": None,
+                "context": self._log_context,
+                **fields,
+            }
+        )
+
     @before_event(Replace, SaveChanges)
     async def _capture_before_state(self):
         """Capture state prior to changes"""
+        if self._original_state:
+            return
         if hasattr(self, "id") and self.id:
             current_doc = await self.__class__.get(self.id)
             if current_doc:
-                self._original_state = current_doc.model_dump(
-                    exclude={"_log_context", "_original_state"}
-                )
+                self._take_snapshot(current_doc)
 
     @after_event(Insert)
     async def _log_insert(self):
         """Log an insert operation"""
-        log_entry = Log(
-            document_id=PydanticObjectId(self.id),
-            collection_name=self.__class__.Settings.name,
-            operation="insert",
-            before_state=None,
-            after_state=self.model_dump(exclude={"_log_context", "_original_state"}),
-            context=self._log_context,
-        )
-        await log_entry.insert()
+        await _write_log(self._log_document("insert", after_state=self.model_dump()))
 
     @after_event(Replace, SaveChanges)
     async def _log_update(self):
         """Log update operations"""
 
-        current_state = self.model_dump(exclude={"_log_context", "_original_state"})
+        dirty_fields, self._dirty_fields = self._dirty_fields, set()
         changes = {}
 
         if self._original_state:
-            for field, new_value in current_state.items():
+            # Assigned values equal to the baseline objects aren't changes;
+            # compare those directly and only dump the fields that differ
+            changed_fields = {
+                field
+                for field in dirty_fields
+                if field not in self._original_values
+                or getattr(self, field, None) != self._original_values[field]
+            }
+            if not changed_fields:
+                return
+            dirty_state = self.model_dump(include=changed_fields)
+            for field, new_value in dirty_state.items():
                 old_value = self._original_state.get(field)
                 if old_value != new_value:
                     changes[field] = {"old_value": old_value, "new_value": new_value}
+            current_state = {**self._original_state, **dirty_state}
+        else:
+            current_state = self.model_dump()
 
         if changes or not self._original_state:
-            log_entry = Log(
-                document_id=PydanticObjectId(self.id),
-                collection_name=self.__class__.Settings.name,
-                operation="update",
-                changes=changes if changes else None,
-                before_state=self._original_state,
-                after_state=current_state,
-                context=self._log_context,
+            await _write_log(
+                self._log_document(
+                    "update",
+                    changes=changes if changes else None,
+                    before_state=self._original_state,
+                    after_state=current_state,
+                )
             )
-            await log_entry.insert()
+
+        # The saved state is the baseline for the next update
+        self._original_state = current_state
+        self._original_values = dict(self)
 
     @before_event(Delete)
     async def _capture_before_delete(self):
-        self._original_state = self.model_dump(
-            exclude={"_log_context", "_original_state"}
-        )
+        self._original_state = self.model_dump()
 
     @after_event(Delete)
     async def _log_delete(self):
         """log delete operation"""
-        log_entry = Log(
-            document_id=PydanticObjectId(self.id),
-            collection_name=self.__class__.Settings.name,
-            operation="delete",
-            before_state=self._original_state,
-            context=self._log_context,
+        await _write_log(
+            self._log_document("delete", before_state=self._original_state)
         )
-
-        await log_entry.insert()
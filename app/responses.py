@@ -0,0 +1,34 @@
+from typing import Any
+
+import orjson
+from beanie import Link
+from bson import DBRef, ObjectId
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """Encode the Mongo/Beanie types orjson does not handle natively"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, Link):
+        return obj.to_dict()
+    if isinstance(obj, DBRef):
+        return {"id": str(obj.id), "collection": obj.collection}
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """
+    orjson response that accepts models dumped in python mode, so routes can
+    skip jsonable_encoder and FastAPI's response_model revalidation.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
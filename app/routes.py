@@ -1,7 +1,14 @@
+import asyncio
+import hashlib
+import logging
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from functools import lru_cache
+import orjson
 from fastapi import (
     APIRouter,
-    Body,
-    Depends,
     Query,
     Request,
     Response,
@@ -9,27 +16,55 @@ from fastapi import (
     UploadFile as FastAPIUploadFile,
     status,
 )
+from beanie import PydanticObjectId
 from pymongo import DESCENDING
 from starlette.datastructures import UploadFile
-from fastapi.encoders import jsonable_encoder
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from typing import Annotated, List, Optional, Type, TypeVar
-from pydantic import BaseModel, ValidationError, model_validator
-from app.models.incidents import IncidentReport, IndustryOverview
-from app.models.articles import Source
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from app.models.incidents import IncidentReport
+from app.models.articles import Source, SourceListing
 from app.incident_service import IncidentService
-from pymongo.errors import DuplicateKeyError
 from app.source_service import SourceService
-from app.dspy_files.news_analysis import PipelineOutput
-from app.interfaces import GenRequest, IncidentFilters
-
+from app.dspy_files.pipeline_output import PipelineOutput
+from app.interfaces import (
+    GenRequest,
+    IncidentFilters,
+    IUUTypeFilter,
+    SourceTypeFilter,
+    StatusFilter,
+    VerifiedFilter,
+)
 
-router = APIRouter()
-import logging
 
 logger = logging.getLogger(__name__)
 
+router = APIRouter()
+
 T = TypeVar("T", bound=BaseModel)
 
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+_PDF_CONTENT_TYPES = frozenset(
+    {"application/pdf", "application/x-pdf", "application/acrobat"}
+)
+_PDF_MAGIC = b"%PDF"
+_FORM_MAX_FILES = 1
+_FORM_MAX_FIELDS = 10
+_MAX_JSON_BODY = 5 * 1024 * 1024
+
+# Back-links between the source, incidents and overview in a pipeline response
+_PIPELINE_EXCLUDE = {
+    "source": {"incidents", "overview"},
+    "incidents": {"__all__": {"sources", "primary_source"}},
+    "industry_overview": {"source"},
+}
+
+# Built once: list pages are serialized with these instead of FastAPI
+# re-validating every item against the response model
+_REPORTS_ADAPTER = TypeAdapter(List[IncidentReport])
+_SOURCES_ADAPTER = TypeAdapter(List[Source])
+_validate_gen_request = GenRequest.__pydantic_validator__.validate_json
+
 
 # Incident Routes
 @router.post(
@@ -48,10 +83,9 @@ async def create_incident_report(request: Request):
         "request_id": request.headers.get("x-request-id"),
     }
     try:
-        if content_type == "application/json":
-            return await _handle_json_request(request, context_data)
-        elif content_type and content_type.startswith("multipart/form-data"):
-            return await _handle_file_request(request, context_data)
+        handler = _BODY_HANDLERS.get(_media_type(content_type or ""))
+        if handler is not None:
+            return await handler(request, context_data)
         else:
             raise HTTPException(
                 status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
@@ -60,47 +94,92 @@ async def create_incident_report(request: Request):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error inserting incident report: {e}")
+        logger.error("Error inserting incident report: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to insert incident report. {e}",
         )
 
 
-def _request_response(pipeline_output: PipelineOutput):
-
+def _request_response(pipeline_output: PipelineOutput) -> Response:
+    # PipelineOutput fields are already typed documents, so there is nothing
+    # to re-check per item; one summary line replaces the per-report logs
     if pipeline_output.is_success:
-        if pipeline_output.has_overview:
-            overview = pipeline_output.industry_overview
-            if isinstance(overview, IndustryOverview):
-                valid_response(overview, IndustryOverview)
-                logger.info(f"Industry Overview created: {overview.id}")
-
-        if pipeline_output.has_incident:
-            for incident in pipeline_output.incidents:
-                report = incident
-                if isinstance(report, IncidentReport):
-                    valid_response(report, IncidentReport)
-                    logger.info(f"Incident report created: {report.id}")
-
-    return pipeline_output.model_dump(
-        exclude={
-            "source": {"incidents", "overview"},
-            "incidents": {"__all__": {"sources", "primary_source"}},
-            "industry_overview": {"source"},
-        }
+        created = [report.id for report in pipeline_output.incidents]
+        overview = pipeline_output.industry_overview
+        logger.info(
+            "Created %d incident reports %s, overview=%s",
+            len(created),
+            created,
+            overview.id if overview else None,
+        )
+
+    # Serialized straight to JSON bytes; returning the dict made FastAPI
+    # re-validate it against PipelineOutput and encode it a second time.
+    # by_alias keeps the "_id" keys of the source, incidents and overview.
+    return Response(
+        content=pipeline_output.model_dump_json(
+            exclude=_PIPELINE_EXCLUDE, by_alias=True
+        ),
+        media_type="application/json",
+        status_code=status.HTTP_201_CREATED,
     )
 
 
+def _body_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Request body exceeds {_MAX_JSON_BODY} bytes",
+    )
+
+
+async def _read_body(request: Request) -> bytes | bytearray:
+    """
+    Read the request body into a buffer sized from Content-Length, instead of
+    collecting chunks and joining them. Bodies without a declared length are
+    counted as they stream in, so both paths stop at _MAX_JSON_BODY.
+    """
+    try:
+        length = int(request.headers.get("content-length", ""))
+    except ValueError:
+        return await _read_unsized_body(request)
+    if length > _MAX_JSON_BODY:
+        raise _body_too_large()
+
+    body = bytearray(length)
+    view = memoryview(body)
+    received = 0
+    async for chunk in request.stream():
+        end = received + len(chunk)
+        if end > length:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Request body is longer than its Content-Length",
+            )
+        view[received:end] = chunk
+        received = end
+    return body if received == length else body[:received]
+
+
+async def _read_unsized_body(request: Request) -> bytearray:
+    """Read a chunked body, rejecting it once it passes _MAX_JSON_BODY"""
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > _MAX_JSON_BODY:
+            raise _body_too_large()
+    return body
+
+
 async def _handle_json_request(request, context_data):
     try:
-        json_payload = await request.json()
-        payload = GenRequest(**json_payload)
+        # Parse and validate the raw body in one pass inside pydantic-core
+        payload = _validate_gen_request(await _read_body(request))
 
         if payload.url:
             existing_source = await _check_for_existing_url(payload.url)
             if existing_source:
-                logger.error(f"Source already exists for {payload.url}")
+                logger.error("Source already exists for %s", payload.url)
                 raise HTTPException(
                     status_code=409,
                     detail=f"Source already exists for {payload.url}",
@@ -112,38 +191,38 @@ async def _handle_json_request(request, context_data):
             raise ValueError("Payload must include either 'text' or 'url'")
         return _request_response(output)
     except ValidationError as e:
-        logger.error(f"Validation error in request: {e}")
+        logger.error("Validation error in request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.errors()
         )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error in request: {e}", exc_info=True)
+        logger.error("Unexpected error in request: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="An unexpected error occurred while processing the request.",
         )
 
 
-async def _handle_file_request(request: Request, context_data: dict) -> dict:
+async def _handle_file_request(request: Request, context_data: dict) -> Response:
     """Handle multipart file request"""
+    form = None
     try:
-        form = await request.form()
-        logger.info(f"Form recevied with keys: {list(form.keys())}")
+        # Parsed chunk by chunk into spooled temp files; only one upload and a
+        # handful of plain fields are accepted before parsing is cut off
+        form = await request.form(
+            max_files=_FORM_MAX_FILES, max_fields=_FORM_MAX_FIELDS
+        )
+        logger.info("Form received with keys: %s", list(form.keys()))
         pdf_file = None
         for key, value in form.items():
-            logger.info(f"Key: {key}, Value type: {type(value)}, Value: {value}")
+            logger.debug("Key: %s, Value type: %s", key, type(value).__name__)
             if isinstance(value, (UploadFile, FastAPIUploadFile)):
                 if not value.filename:
                     continue
 
-                allowed_types = [
-                    "application/pdf",
-                    "application/x-pdf",
-                    "application/acrobat",
-                ]
-                if value.content_type not in allowed_types:
+                if value.content_type not in _PDF_CONTENT_TYPES:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail=f"File must be a PDF. Received: {value.content_type}",
@@ -157,35 +236,88 @@ async def _handle_file_request(request: Request, context_data: dict) -> dict:
                 detail="No PDF file found in request",
             )
 
-        pdf_bytes = await pdf_file.read()
+        # Cheap reject for mislabeled uploads before the extraction pipeline
+        header = await pdf_file.read(len(_PDF_MAGIC))
+        await pdf_file.seek(0)
+        if header != _PDF_MAGIC:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File content is not a PDF",
+            )
 
-        output = await IncidentService.create_report_from_pdf(
-            pdf_bytes, pdf_file.filename
-        )
+        # Copy the spooled upload to a named file in chunks so the PDF is
+        # opened from disk rather than held in memory as one bytes object
+        with tempfile.NamedTemporaryFile(suffix=".pdf") as pdf_path:
+            await asyncio.to_thread(
+                shutil.copyfileobj, pdf_file.file, pdf_path, _UPLOAD_CHUNK_SIZE
+            )
+            pdf_path.flush()
+            output = await IncidentService.create_report_from_pdf(
+                pdf_path.name, pdf_file.filename
+            )
 
         return _request_response(output)
 
-    except HTTPException:
+    except StarletteHTTPException:
+        # Includes the 400 raised when the form exceeds the limits above
         raise
     except Exception as e:
-        logger.error(f"Unexpected error in file request: {e}", exc_info=True)
+        logger.error("Unexpected error in file request: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="An unexpected error occurred while processing the file.",
         )
+    finally:
+        if form is not None:
+            await form.close()
+
+
+@lru_cache(maxsize=64)
+def _media_type(content_type: str) -> str:
+    """Media type of a Content-Type header, without parameters or boundary"""
+    return content_type.partition(";")[0].strip().lower()
 
 
-async def _check_for_existing_url(url: str) -> Source | None:
+_BODY_HANDLERS = {
+    "application/json": _handle_json_request,
+    "multipart/form-data": _handle_file_request,
+}
+
+
+# URLs recently found to have a source, for repeat submissions. Only hits are
+# cached: a miss can turn into a hit from another worker at any time, and the
+# TTL bounds how long a deleted source keeps blocking its URL.
+_EXISTING_URL_TTL = 300.0  # seconds
+_EXISTING_URL_CACHE_SIZE = 10_000
+_existing_urls: OrderedDict[str, float] = OrderedDict()
+
+
+async def _check_for_existing_url(url: str) -> bool:
     """
     Check if a report already exists for the given URL.
-    Adjust this query based on your actual data model structure.
+    Answered from the unique url index alone; no document is fetched.
     """
+    cached_at = _existing_urls.get(url)
+    if cached_at is not None and time.monotonic() - cached_at < _EXISTING_URL_TTL:
+        _existing_urls.move_to_end(url)
+        return True
+
     try:
-        existing = await Source.find_one(Source.url == url)
-        return existing
+        # The $type clause lets the planner use the partial url index, and
+        # projecting only url makes the query covered by it
+        existing = await Source.get_pymongo_collection().find_one(
+            {"url": {"$eq": url, "$type": "string"}}, {"_id": 0, "url": 1}
+        )
     except Exception as e:
-        logger.warning(f"Error checking for existing report: {e}")
-        return None
+        logger.warning("Error checking for existing report: %s", e)
+        return False
+
+    if existing is None:
+        return False
+    _existing_urls[url] = time.monotonic()
+    if len(_existing_urls) > _EXISTING_URL_CACHE_SIZE:
+        _existing_urls.popitem(last=False)
+    return True
 
 
 @router.get("/incidents")
@@ -194,52 +326,136 @@ async def list_incident_reports(filter_query: Annotated[IncidentFilters, Query()
     Retrieves a list of incident reports with pagination and filtering.
     """
     query_filters = {}
+    source_stages = []
+
+    if filter_query.source_type is not SourceTypeFilter.ALL:
+        # Join only the category of each candidate's primary source on the
+        # server, rather than inlining every matching source id into an $in
+        source_stages = [
+            {
+                "$lookup": {
+                    "from": Source.get_collection_name(),
+                    "localField": "primary_source.$id",
+                    "foreignField": "_id",
+                    "pipeline": [{"$project": {"_id": 0, "category": 1}}],
+                    "as": "_primary_source",
+                }
+            },
+            {"$match": {"_primary_source.category": filter_query.source_type.value}},
+            {"$project": {"_primary_source": 0}},
+        ]
 
-    if filter_query.source_type != "all":
-        query_filters["primary_source.category"] = filter_query.source_type
-
-    if filter_query.verified != "all":
-        query_filters["verified"] = filter_query.verified == "true"
+    if filter_query.verified is not VerifiedFilter.ALL:
+        query_filters["verified"] = filter_query.verified is VerifiedFilter.TRUE
 
-    if filter_query.IUU_type != "all":
+    if filter_query.IUU_type is not IUUTypeFilter.ALL:
         query_filters["incident_classification.iuuClassifications"] = {
-            "$elemMatch": {"IUUType": filter_query.IUU_type}
+            "$elemMatch": {"IUUType": filter_query.IUU_type.value}
         }
-    if filter_query.status != "all":
-        query_filters["status"] = filter_query.status
-    sort_direction = DESCENDING
-    sort_field = filter_query.sort_by
-
-    logger.info(f"Query Filters: {query_filters}")
-    reports = (
-        await IncidentReport.find(query_filters, fetch_links=True, nesting_depth=1)
-        .sort([(sort_field, sort_direction)])
-        .skip(filter_query.skip)
-        .limit(filter_query.limit)
-        .to_list()
+    if filter_query.status is not StatusFilter.ALL:
+        query_filters["status"] = filter_query.status.value
+
+    logger.info("Query Filters: %s", query_filters)
+    page_filters = dict(query_filters)
+    skip = filter_query.skip
+    if filter_query.after:
+        # Keyset page: seek past the cursor report instead of skipping documents
+        skip = 0
+        page_filters["_id"] = {"$lt": filter_query.after}
+
+    # Newest first; ordering and seeking both run on the _id index
+    if source_stages:
+        # Sorted before the join so the _id index orders the scan and the
+        # lookup stops once the page is filled
+        reports = await IncidentReport.aggregate(
+            [
+                {"$match": page_filters},
+                {"$sort": {"_id": DESCENDING}},
+                *source_stages,
+                {"$skip": skip},
+                {"$limit": filter_query.limit},
+            ],
+            projection_model=IncidentReport,
+        ).to_list()
+        counted = await IncidentReport.aggregate(
+            [{"$match": query_filters}, *source_stages, {"$count": "total"}]
+        ).to_list()
+        total_count = counted[0]["total"] if counted else 0
+    else:
+        reports = (
+            await IncidentReport.find(page_filters)
+            .sort([("_id", DESCENDING)])
+            .skip(skip)
+            .limit(filter_query.limit)
+            .to_list()
+        )
+        total_count = await IncidentReport.find(query_filters).count()
+    # List views show source metadata only; leave the article text on the server
+    await IncidentReport.fetch_sources(reports, projection_model=SourceListing)
+
+    next_cursor = str(reports[-1].id) if len(reports) == filter_query.limit else None
+
+    pagination = {
+        "total": total_count,
+        "skip": skip,
+        "limit": filter_query.limit,
+        "has_more": (
+            next_cursor is not None
+            if filter_query.after
+            else (skip + filter_query.limit) < total_count
+        ),
+        "next": next_cursor,
+    }
+    # The reports are encoded by pydantic-core straight to bytes and spliced
+    # into the envelope, so no intermediate dicts are built for them. by_alias
+    # keeps Beanie's "_id" key on reports and their sources.
+    reports_json = _REPORTS_ADAPTER.dump_json(reports, by_alias=True)
+    return Response(
+        b'{"reports":%b,"pagination":%b}' % (reports_json, orjson.dumps(pagination)),
+        media_type="application/json",
     )
 
-    total_count = await IncidentReport.find(query_filters).count()
 
-    return {
-        "reports": reports,
-        "pagination": {
-            "total": total_count,
-            "skip": filter_query.skip,
-            "limit": filter_query.limit,
-            "has_more": (filter_query.skip + filter_query.limit) < total_count,
-        },
-    }
+# Encoded report bodies for repeat reads. Edits and deletes in this worker
+# evict their entry; the short TTL bounds how long other workers serve a
+# report that was changed elsewhere.
+_REPORT_CACHE_TTL = 10.0  # seconds
+_REPORT_CACHE_SIZE = 1_000
+_report_cache: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+
+def _cached_report(report_id: str) -> bytes | None:
+    cached = _report_cache.get(report_id)
+    if cached is None:
+        return None
+    if time.monotonic() - cached[0] >= _REPORT_CACHE_TTL:
+        del _report_cache[report_id]
+        return None
+    _report_cache.move_to_end(report_id)
+    return cached[1]
+
+
+def _cache_report(report_id: str, body: bytes) -> None:
+    _report_cache[report_id] = (time.monotonic(), body)
+    _report_cache.move_to_end(report_id)
+    if len(_report_cache) > _REPORT_CACHE_SIZE:
+        _report_cache.popitem(last=False)
 
 
 @router.get("/incidents/{report_id}", response_model=IncidentReport)
-async def get_incident_report(report_id: str):
+async def get_incident_report(report_id: str, request: Request):
     """
     Retrieves a specific incident report by its ID.
     """
-    report = await IncidentReport.get(report_id)
-    valid_response(report, IncidentReport)
-    return report
+    body = _cached_report(report_id)
+    if body is None:
+        report = await IncidentReport.get(report_id)
+        _ensure_found(report, IncidentReport)
+        body = report.model_dump_json(by_alias=True).encode()
+        _cache_report(report_id, body)
+    return _conditional_response(
+        request, Response(body, media_type="application/json")
+    )
 
 
 @router.delete(
@@ -252,6 +468,7 @@ async def delete_incident(report_id: str):
     Deletes an incident report by its ID.
     """
 
+    _report_cache.pop(report_id, None)
     try:
         was_deleted = await IncidentService.delete_report(report_id=report_id)
         if was_deleted:
@@ -262,7 +479,7 @@ async def delete_incident(report_id: str):
                 detail="Incident report not found",
             )
     except Exception as e:
-        logger.error(f"Error deleting incident report {report_id}: {e}")
+        logger.error("Error deleting incident report %s: %s", report_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete incident report.",
@@ -273,11 +490,14 @@ async def delete_incident(report_id: str):
 async def update_incident_report(report_id: str, update_data: IncidentReport):
     """Updates an existing incident report by its ID."""
     try:
+        # The body is already validated; pass its field values through as-is
+        # rather than dumping to dicts that update_report has to re-validate
         updated_report = await IncidentService.update_report(
-            report_id=report_id, update_data=update_data.model_dump()
+            report_id=report_id, update_data=dict(update_data)
         )
-        valid_response(updated_report, IncidentReport)
-        return updated_report
+        _report_cache.pop(report_id, None)
+        _ensure_found(updated_report, IncidentReport)
+        return _json_response(updated_report)
     except HTTPException:
         raise
     except Exception as e:
@@ -293,16 +513,34 @@ async def update_incident_report(report_id: str, update_data: IncidentReport):
 
 # Source routes
 @router.get("/sources", response_model=List[Source])
-async def list_sources(skip: int = 0, limit: int = 25):
-    sources = await Source.find_all().skip(skip).limit(limit).to_list()
-    return sources
+async def list_sources(
+    skip: int = 0, limit: int = 25, after: PydanticObjectId | None = None
+):
+    """
+    Lists sources newest first. Pass the last source's id as `after` (also
+    returned in the X-Next-Cursor header) to get the next page by index seek
+    rather than skipping.
+    """
+    query = Source.find(Source.id < after) if after else Source.find_all()
+    sources = (
+        await query.sort([("_id", DESCENDING)])
+        .skip(0 if after else skip)
+        .limit(limit)
+        .to_list()
+    )
+    headers = {"X-Next-Cursor": str(sources[-1].id)} if len(sources) == limit else None
+    return Response(
+        _SOURCES_ADAPTER.dump_json(sources, by_alias=True),
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 @router.get("/sources/{source_id}", response_model=Source)
-async def get_source(source_id: str):
+async def get_source(source_id: str, request: Request):
     source = await Source.get(source_id)
-    valid_response(source, Source)
-    return source
+    _ensure_found(source, Source)
+    return _conditional_response(request, _json_response(source))
 
 
 @router.delete(
@@ -312,35 +550,58 @@ async def get_source(source_id: str):
 )
 async def delete_source(source_id: str):
     try:
-        was_deleted = await SourceService.delete(source_id)
-        if was_deleted:
-            return
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Source not found",
-            )
+        source = await SourceService.delete_source(source_id)
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error deleting source {source_id}: {e}")
+        logger.error("Error deleting source %s: %s", source_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete source.",
         )
+    if source.url:
+        # The url may be submitted again straight away
+        _existing_urls.pop(source.url, None)
 
 
 @router.put("/sources/{source_id}", response_model=Source)
 async def update_source(source_id: str, update_data: Source):
+    # Only the fields the client sent, so defaults do not overwrite stored values
     updated_source = await SourceService.update_source(
-        source_id=source_id, update_data=update_data
+        source_id=source_id,
+        update_data={f: getattr(update_data, f) for f in update_data.model_fields_set},
+    )
+    return _json_response(updated_source)
+
+
+def _json_response(document: BaseModel) -> Response:
+    """Serialize a document to JSON bytes in one pass inside pydantic-core"""
+    # by_alias keeps Beanie's "_id" key, as the response_model encoding emitted
+    return Response(
+        document.model_dump_json(by_alias=True), media_type="application/json"
     )
-    return updated_source
 
 
-def valid_response(response: Optional[T], pydanticModel: Type[T]):
+def _conditional_response(request: Request, response: Response) -> Response:
     """
-    Helper function to throw an exception if the response is not valid.
+    Tag a rendered response with an ETag of its body and answer 304 when the
+    client already holds that version. Documents carry no modification time,
+    so the tag is a digest of the bytes that would be sent.
     """
-    if not response:
+    etag = f'"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return response
+
+
+def _ensure_found(response: Optional[T], pydanticModel: Type[T]) -> None:
+    """
+    Raise a 404 if a lookup found nothing. For handlers whose result type is
+    already fixed by the Beanie query, so no isinstance check is needed.
+    """
+    if response is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -349,15 +610,6 @@ def valid_response(response: Optional[T], pydanticModel: Type[T]):
             },
         )
 
-    if not isinstance(response, pydanticModel):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "invalid_response",
-                "message": f"Expected {pydanticModel.__name__}, got {type(response).__name__}",
-            },
-        )
-
 
 @router.get("/test")
 async def test_route():
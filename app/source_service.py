@@ -1,15 +1,26 @@
 import logging
 
 from fastapi import HTTPException, status
+from pymongo.errors import DuplicateKeyError
 
-from app.models.articles import Source
+from app.models.articles import Source, _hash_text
 
 logger = logging.getLogger(__name__)
 
+# Identity, the derived hash and the links to reports are managed by the
+# pipeline, not by source edits
+_UPDATABLE_FIELDS = frozenset(Source.model_fields) - {
+    "id",
+    "revision_id",
+    "article_hash",
+    "incidents",
+    "overview",
+}
+
 
 class SourceService:
     @staticmethod
-    async def delete_source(source_id: str) -> bool:
+    async def delete_source(source_id: str) -> Source:
         source = await Source.get(source_id)
         if not source:
             raise HTTPException(
@@ -19,16 +30,44 @@ class SourceService:
 
         try:
             await source.delete()
-            logger.info(f"Successfully deleted source {source_id}")
+            logger.info("Successfully deleted source %s", source_id)
         except Exception as e:
-            logger.error(f"Deleted failed for source {source_id}: {e}")
+            logger.error("Deleted failed for source %s: %s", source_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to delete the source.",
             )
-        return True
+        return source
 
     @staticmethod
     async def update_source(source_id: str, update_data: dict) -> Source:
-        logger.warning("Updating source not yet implemented")
-        pass
+        source = await Source.get(source_id)
+        if not source:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Source with ID {source_id} not found",
+            )
+
+        for field, value in update_data.items():
+            if field in _UPDATABLE_FIELDS:
+                setattr(source, field, value)
+        if "article_text" in update_data:
+            # save() fires neither Insert nor Replace, so the model's hash hook
+            # does not run; keep the dedup key in step with the new text
+            source.article_hash = _hash_text(source.article_text)
+
+        try:
+            await source.save()
+            logger.info("Successfully updated source %s", source_id)
+        except DuplicateKeyError:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Another source already has this url or text",
+            )
+        except Exception as e:
+            logger.error("Update failed for source %s: %s", source_id, e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to update the source.",
+            )
+        return source
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 import json
 import external_apis as fn
@@ -18,12 +19,12 @@ if not iucn_api_key:
         "IUCN_API_KEY not found in environment variables. Please set it in your .env file."
     )
 
-lowest_classification = pd.read_csv("test.csv")
+# Each taxon is two independent, network-bound paginated fetches; overlap them
+# across taxa instead of waiting on every round trip in turn
+MAX_WORKERS = 16
 
-for index, row in lowest_classification.iterrows():
-    taxon_name = row["name"]
-    taxon_rank = row["level"]
 
+def save_taxon(taxon_name: str, taxon_rank: str) -> None:
     response = fn.fetch_all_cites_pages(taxon_name, cites_api_key)
     if response:
         with open(f"cites_{taxon_name}.json", "w") as f:
@@ -35,3 +36,12 @@ for index, row in lowest_classification.iterrows():
         with open(f"iucn_{taxon_name}.json", "w") as f:
             json.dump(response, f, indent=4)
         print(f"Data for '{taxon_name}' saved to iucn_{taxon_name}.json")
+
+
+lowest_classification = pd.read_csv("test.csv", usecols=["name", "level"])
+taxa = lowest_classification.itertuples(index=False, name=None)
+
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    futures = [executor.submit(save_taxon, name, rank) for name, rank in taxa]
+    for future in as_completed(futures):
+        future.result()
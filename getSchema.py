@@ -1,12 +1,19 @@
 import json
-from pydantic import BaseModel
+from pathlib import Path
 from app.models.articles import Source
 from app.models.incidents import IncidentReport
 
 
-source_schema = Source.model_json_schema()
-with open("source_schema.json", "w") as f:
-    json.dump(source_schema, f, indent=2)
-incident_schema = IncidentReport.model_json_schema()
-with open("incident_schema.json", "w") as f:
-    json.dump(incident_schema, f, indent=2)
+def write_if_changed(path: str, schema: dict) -> None:
+    """Write the schema only when it differs, leaving unchanged files untouched"""
+    target = Path(path)
+    content = json.dumps(schema, indent=2)
+    if target.exists() and target.read_text() == content:
+        print(f"{path} is up to date")
+        return
+    target.write_text(content)
+    print(f"Wrote {path}")
+
+
+write_if_changed("source_schema.json", Source.model_json_schema())
+write_if_changed("incident_schema.json", IncidentReport.model_json_schema())
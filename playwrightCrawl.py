@@ -3,12 +3,57 @@ Website Article Scraper using Playwright
 Searches websites for articles related to given keywords and stores URLs in JSON.
 """
 
-import json
+import orjson
 import asyncio
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright.async_api import async_playwright
 import argparse
+import re
+
+SELECTOR_TIMEOUT_MS = 5000
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# Only the DOM and its scripts are read; everything else is wasted transfer
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+# Ad and analytics hosts, matched along with their subdomains
+BLOCKED_DOMAINS = frozenset(
+    {
+        "googletagmanager.com",
+        "google-analytics.com",
+        "doubleclick.net",
+        "googlesyndication.com",
+        "adservice.google.com",
+        "facebook.net",
+        "hotjar.com",
+        "scorecardresearch.com",
+        "quantserve.com",
+        "chartbeat.com",
+        "taboola.com",
+        "outbrain.com",
+        "amazon-adsystem.com",
+        "criteo.com",
+        "newrelic.com",
+        "nr-data.net",
+    }
+)
+
+
+def _is_blocked_host(host):
+    """True if the host or any parent domain is in BLOCKED_DOMAINS"""
+    parts = host.split(".")
+    return any(".".join(parts[i:]) in BLOCKED_DOMAINS for i in range(len(parts) - 1))
+
+
+async def _skip_unread_resources(route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or _is_blocked_host(
+        urlparse(request.url).hostname or ""
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
 
 
 class BaseScraper:
@@ -22,6 +67,20 @@ class BaseScraper:
         """Override this method for site-specific search logic"""
         return []
 
+    async def link_pairs(self, page, selector):
+        """(href attribute, text) of every match, read in a single round trip"""
+        return await page.eval_on_selector_all(
+            selector, "els => els.map(e => [e.getAttribute('href'), e.textContent])"
+        )
+
+    async def wait_for_any(self, page, selectors, timeout=SELECTOR_TIMEOUT_MS):
+        """Wait until any of the selectors matches instead of sleeping a fixed time"""
+        try:
+            await page.wait_for_selector(", ".join(selectors), timeout=timeout)
+        except PlaywrightTimeoutError:
+            # Nothing matched in time; let the caller read whatever rendered
+            pass
+
     def extract_article_urls(self, page_content, base_url):
         """Basic fallback method to extract article URLs"""
         # This is a simple implementation - can be enhanced
@@ -31,6 +90,18 @@ class BaseScraper:
 class UndercurrentNewsScraper(BaseScraper):
     """Scraper for Undercurrent News"""
 
+    SKIP_PATTERNS = (
+        "#",
+        "javascript:",
+        "mailto:",
+        "/feed",
+        "/category",
+        "/tag",
+        "/author",
+    )
+    SKIP_RE = re.compile("|".join(map(re.escape, SKIP_PATTERNS)))
+    SKIP_TITLES = frozenset({"search", "archive", "home", "about", "contact", ""})
+
     def __init__(self):
         super().__init__("https://www.undercurrentnews.com", "Undercurrent News")
 
@@ -45,8 +116,9 @@ class UndercurrentNewsScraper(BaseScraper):
         for search_url in search_urls:
             try:
                 print(f"Trying URL: {search_url}")
-                await page.goto(search_url, wait_until="load", timeout=15000)
-                await page.wait_for_timeout(15000)
+                await page.goto(
+                    search_url, wait_until="domcontentloaded", timeout=15000
+                )
 
                 # If we're on homepage, look for recent articles
                 if search_url == self.base_url:
@@ -66,19 +138,19 @@ class UndercurrentNewsScraper(BaseScraper):
                         ".post .entry-title a",
                         ".search-result h2 a, .search-result h3 a",
                     ]
+                await self.wait_for_any(page, article_selectors)
 
                 urls = []
+                seen = set()
                 for selector in article_selectors:
                     try:
-                        article_links = await page.query_selector_all(selector)
-
-                        for link in article_links:
-                            href = await link.get_attribute("href")
-                            title = await link.text_content()
+                        article_links = await self.link_pairs(page, selector)
 
+                        for href, title in article_links:
                             if href and title and self._is_valid_article(href, title):
                                 full_url = urljoin(self.base_url, href)
-                                if full_url not in [item["url"] for item in urls]:
+                                if full_url not in seen:
+                                    seen.add(full_url)
                                     urls.append(
                                         {
                                             "url": full_url,
@@ -102,27 +174,22 @@ class UndercurrentNewsScraper(BaseScraper):
 
     def _is_valid_article(self, href, title):
         """Check if this is likely a real article"""
-        skip_patterns = [
-            "#",
-            "javascript:",
-            "mailto:",
-            "/feed",
-            "/category",
-            "/tag",
-            "/author",
-        ]
-        skip_titles = ["search", "archive", "home", "about", "contact", ""]
-
+        href = href.lower()
+        title = title.strip()
         return (
-            not any(pattern in href.lower() for pattern in skip_patterns)
-            and title.lower().strip() not in skip_titles
-            and len(title.strip()) > 5
+            not self.SKIP_RE.search(href)
+            and title.lower() not in self.SKIP_TITLES
+            and len(title) > 5
         )
 
 
 class JusticeGovScraper(BaseScraper):
     """Scraper for Justice.gov"""
 
+    SKIP_PATTERNS = ("#", "javascript:", "mailto:", "/search")
+    SKIP_RE = re.compile("|".join(map(re.escape, SKIP_PATTERNS)))
+    SKIP_TITLES = frozenset({"search", "archive", "home", "about", "contact", ""})
+
     def __init__(self):
         super().__init__("https://www.justice.gov", "Justice.gov")
 
@@ -132,8 +199,7 @@ class JusticeGovScraper(BaseScraper):
         search_url = f"https://search.justice.gov/search?query={search_query}&op=Search&affiliate=justice"
 
         try:
-            await page.goto(search_url, wait_until="networkidle")
-            await page.wait_for_timeout(3000)  # Wait for search results to load
+            await page.goto(search_url, wait_until="domcontentloaded")
 
             # More specific selectors for Justice.gov search results
             article_selectors = [
@@ -141,15 +207,14 @@ class JusticeGovScraper(BaseScraper):
                 ".search-result-item h3 a",
                 ".gsc-result .gs-title a",
             ]
+            await self.wait_for_any(page, article_selectors)
 
             urls = []
+            seen = set()
             for selector in article_selectors:
-                article_links = await page.query_selector_all(selector)
-
-                for link in article_links:
-                    href = await link.get_attribute("href")
-                    title = await link.text_content()
+                article_links = await self.link_pairs(page, selector)
 
+                for href, title in article_links:
                     if href and title and self._is_valid_article(href, title):
                         # Ensure we have full URLs
                         if href.startswith("http"):
@@ -157,9 +222,8 @@ class JusticeGovScraper(BaseScraper):
                         else:
                             full_url = urljoin(self.base_url, href)
 
-                        if full_url not in [
-                            item["url"] for item in urls
-                        ]:  # Avoid duplicates
+                        if full_url not in seen:  # Avoid duplicates
+                            seen.add(full_url)
                             urls.append(
                                 {
                                     "url": full_url,
@@ -175,20 +239,36 @@ class JusticeGovScraper(BaseScraper):
 
     def _is_valid_article(self, href, title):
         """Check if this is likely a real article"""
-        skip_patterns = ["#", "javascript:", "mailto:", "/search"]
-        skip_titles = ["search", "archive", "home", "about", "contact", ""]
-
+        href = href.lower()
+        title = title.strip()
         return (
-            not any(pattern in href.lower() for pattern in skip_patterns)
-            and title.lower().strip() not in skip_titles
-            and len(title.strip()) > 10
-            and "justice.gov" in href.lower()
+            not self.SKIP_RE.search(href)
+            and title.lower() not in self.SKIP_TITLES
+            and len(title) > 10
+            and "justice.gov" in href
         )
 
 
 class GenericScraper(BaseScraper):
     """Generic fallback scraper for any website"""
 
+    # Skip navigation links, images, etc.
+    SKIP_PATTERNS = (
+        "#",
+        "javascript:",
+        "mailto:",
+        ".jpg",
+        ".png",
+        ".pdf",
+        "/feed",
+        "/category",
+        "/tag",
+        "/author",
+        "/search",
+        "/archive",
+    )
+    SKIP_RE = re.compile("|".join(map(re.escape, SKIP_PATTERNS)))
+
     def __init__(self, base_url, name):
         super().__init__(base_url, name)
 
@@ -205,7 +285,7 @@ class GenericScraper(BaseScraper):
 
         for search_url in search_patterns:
             try:
-                await page.goto(search_url, wait_until="networkidle")
+                await page.goto(search_url, wait_until="domcontentloaded")
 
                 # Generic selectors for article links
                 selectors = [
@@ -216,15 +296,18 @@ class GenericScraper(BaseScraper):
                     ".entry-title a[href]",
                     ".title a[href]",
                 ]
+                await self.wait_for_any(page, selectors)
 
                 urls = []
+                seen = set()
                 for selector in selectors:
-                    links = await page.query_selector_all(selector)
-                    for link in links:
-                        href = await link.get_attribute("href")
-                        title = await link.text_content()
+                    links = await self.link_pairs(page, selector)
+                    for href, title in links:
                         if href and self._is_article_link(href):
                             full_url = urljoin(self.base_url, href)
+                            if full_url in seen:
+                                continue
+                            seen.add(full_url)
                             urls.append(
                                 {
                                     "url": full_url,
@@ -244,25 +327,7 @@ class GenericScraper(BaseScraper):
 
     def _is_article_link(self, href):
         """Basic heuristic to determine if a link might be an article"""
-        # Skip navigation links, images, etc.
-        skip_patterns = [
-            "#",
-            "javascript:",
-            "mailto:",
-            ".jpg",
-            ".png",
-            ".pdf",
-            "/feed",
-            "/category",
-            "/tag",
-            "/author",
-            "/search",
-            "/archive",
-        ]
-        return (
-            not any(pattern in href.lower() for pattern in skip_patterns)
-            and len(href) > 10
-        )
+        return not self.SKIP_RE.search(href.lower()) and len(href) > 10
 
 
 class ArticleScraper:
@@ -274,6 +339,7 @@ class ArticleScraper:
             "www.justice.gov": JusticeGovScraper(),
         }
         self.results = []
+        self._seen = set()
 
     def add_generic_scraper(self, url, name):
         """Add a generic scraper for a new site"""
@@ -282,6 +348,15 @@ class ArticleScraper:
 
     async def scrape_site(self, site_url, keywords, name=None):
         """Scrape a single site for articles"""
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                await self._scrape_with_browser(browser, site_url, keywords, name)
+            finally:
+                await browser.close()
+
+    async def _scrape_with_browser(self, browser, site_url, keywords, name=None):
+        """Scrape one site in its own context of an already running browser"""
         domain = urlparse(site_url).netloc.lower()
         # Use specific scraper if available, otherwise create generic one
         if domain in self.scrapers:
@@ -290,52 +365,70 @@ class ArticleScraper:
             scraper_name = name or domain
             scraper = GenericScraper(site_url, scraper_name)
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            )
-            page = await context.new_page()
+        context = await browser.new_context(user_agent=USER_AGENT)
+        await context.route("**/*", _skip_unread_resources)
+        page = await context.new_page()
 
-            try:
-                print(f"Scraping {scraper.name}...")
-                urls = await scraper.search(page, keywords)
-                self.results.extend(urls)
-                print(f"Found {len(urls)} articles on {scraper.name}")
+        try:
+            print(f"Scraping {scraper.name}...")
+            urls = await scraper.search(page, keywords)
+            # Drop articles already collected from another site
+            urls = [item for item in urls if item["url"] not in self._seen]
+            self._seen.update(item["url"] for item in urls)
+            self.results.extend(urls)
+            print(f"Found {len(urls)} articles on {scraper.name}")
+
+            # Print first few results for debugging
+            for i, url in enumerate(urls[:3]):
+                print(
+                    f"  {i+1}. {url['title'][:60]}{'...' if len(url['title']) > 60 else ''}"
+                )
 
-                # Print first few results for debugging
-                for i, url in enumerate(urls[:3]):
-                    print(
-                        f"  {i+1}. {url['title'][:60]}{'...' if len(url['title']) > 60 else ''}"
-                    )
+        except Exception as e:
+            print(f"Error scraping {scraper.name}: {e}")
+        finally:
+            await context.close()
+
+    async def scrape_multiple_sites(self, sites, keywords, concurrency=None):
+        """
+        Scrape multiple sites concurrently, one browser context per site.
+        All sites run at once unless concurrency caps the open contexts.
+        """
+        slots = asyncio.Semaphore(max(1, concurrency)) if concurrency else None
+
+        async def scrape_one(browser, url, name):
+            if slots is None:
+                await self._scrape_with_browser(browser, url, keywords, name)
+                return
+            async with slots:
+                await self._scrape_with_browser(browser, url, keywords, name)
 
-            except Exception as e:
-                print(f"Error scraping {scraper.name}: {e}")
+        async with async_playwright() as p:
+            # One Chromium process for the whole run instead of one per site
+            browser = await p.chromium.launch(headless=True)
+            try:
+                tasks = []
+                for site in sites:
+                    if isinstance(site, dict):
+                        url, name = site["url"], site.get("name")
+                    else:
+                        url, name = site, None
+                    tasks.append(scrape_one(browser, url, name))
+
+                await asyncio.gather(*tasks)
             finally:
                 await browser.close()
 
-    async def scrape_multiple_sites(self, sites, keywords):
-        """Scrape multiple sites concurrently"""
-        tasks = []
-        for site in sites:
-            if isinstance(site, dict):
-                task = self.scrape_site(site["url"], keywords, site.get("name"))
-            else:
-                task = self.scrape_site(site, keywords)
-            tasks.append(task)
-
-        await asyncio.gather(*tasks)
-
     def save_results(self, filename="article_urls.json"):
         """Save results to JSON file"""
         data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "total_articles": len(self.results),
             "articles": self.results,
         }
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
         print(f"Saved {len(self.results)} articles to {filename}")
 
@@ -14,7 +14,10 @@ async def main():
         page = await browser.new_page()
 
         try:
-            await page.goto("https://www.undercurrentnews.com/?s=illegal")
+            await page.goto(
+                "https://www.undercurrentnews.com/?s=illegal",
+                wait_until="domcontentloaded",
+            )
             await page.wait_for_selector("div.ucn-search-articles")
 
             # Get all search result containers